@@ -0,0 +1,103 @@
+"""Asyncio integration for the Tk main loop."""
+import asyncio
+import concurrent.futures
+import statistics
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+from utilities import logger
+
+
+class AsyncBridge:
+    """Runs an asyncio loop beside the Tk main loop.
+
+    The asyncio loop lives on its own thread and sleeps in its selector,
+    Tk sleeps in its own event loop, and results cross back to Tk through
+    ``root.after``, so neither side polls the other.
+    """
+
+    def __init__(self, root: Any):
+        """Initialize the bridge without starting the loop."""
+        self.root = root
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="asyncio-loop",
+                                        daemon=True)
+
+    def start(self) -> None:
+        """Start the asyncio loop thread."""
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Run the loop until stopped, then cancel what is left."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to finish."""
+        if self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=2)
+
+    def submit(self, coro: Awaitable, on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None
+               ) -> concurrent.futures.Future:
+        """Run a coroutine on the loop and hand its outcome to Tk callbacks."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def deliver(done: concurrent.futures.Future) -> None:
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                if on_error:
+                    self.call_in_tk(on_error, error)
+                else:
+                    logger.error("Background task failed: %s", error)
+            elif on_done:
+                self.call_in_tk(on_done, done.result())
+
+        future.add_done_callback(deliver)
+        return future
+
+    def call_in_tk(self, callback: Callable[..., None], *args: Any) -> None:
+        """Schedule a callback on the Tk thread."""
+        try:
+            self.root.after(0, callback, *args)
+        except RuntimeError:
+            # The main loop has already gone away during shutdown
+            pass
+
+    async def run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Await a blocking function run on the loop's thread pool."""
+        return await self.loop.run_in_executor(None, fn, *args)
+
+    def measure_ui_latency(self, on_done: Callable[[List[float]], None],
+                           samples: int = 100, interval_ms: int = 10) -> None:
+        """Measure how late Tk runs timer callbacks, in milliseconds.
+
+        Each sample schedules an ``after`` callback and records how long
+        past its due time it ran, which is the delay any UI event would see.
+        """
+        delays: List[float] = []
+
+        def tick(due: float) -> None:
+            delays.append(max(0.0, (time.perf_counter() - due) * 1000))
+            if len(delays) < samples:
+                self.root.after(interval_ms, tick, time.perf_counter() + interval_ms / 1000)
+            else:
+                on_done(delays)
+
+        self.root.after(interval_ms, tick, time.perf_counter() + interval_ms / 1000)
+
+
+def summarize_latency(delays: List[float]) -> str:
+    """Format UI delay samples as median, p95 and max."""
+    ordered = sorted(delays)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"UI delay: median {statistics.median(ordered):.2f} ms, "
+            f"p95 {p95:.2f} ms, max {ordered[-1]:.2f} ms over {len(ordered)} samples")
@@ -0,0 +1,575 @@
+"""
+Benchmarks for the launcher application
+Run `python benchmarks.py [name ...]`. GUI benchmarks need a display; on
+Linux without one they start a virtual X server (Xvfb).
+
+The hot_paths suite times launcher operations on synthetic layouts and
+compares them with benchmarks_baseline.json, exiting non-zero when an
+operation regresses past the threshold or has no baseline to compare
+with. Use --save-baseline to record a new baseline.
+"""
+
+import argparse
+import atexit
+import copy
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from layout import Layout
+
+BASELINE_FILE = Path(__file__).parent / "benchmarks_baseline.json"
+HOT_PATH_SIZES = (10, 100, 1000)
+DRAG_MOTION_EVENTS = 500
+
+# Operation name -> (milliseconds, peak KiB)
+Results = Dict[str, Tuple[float, float]]
+
+
+def synthetic_layout(count: int, columns: int = 3) -> Layout:
+    """Build a layout of `count` tiles named tile0, tile1, ..."""
+    return Layout.from_list([(f"tile{i}", i // columns, i % columns)
+                             for i in range(count)])
+
+
+def count_widgets(widget: Any) -> int:
+    """Count a Tk widget and all of its descendants."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def ensure_display() -> None:
+    """Start a virtual X server when running headless on Linux."""
+    if not sys.platform.startswith("linux") or os.environ.get("DISPLAY"):
+        return
+    if shutil.which("Xvfb") is None:
+        raise SystemExit("GUI benchmarks need a display or Xvfb on PATH")
+    display = f":{100 + os.getpid() % 1000}"
+    server = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    atexit.register(server.terminate)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+
+
+def stub_keyboard() -> None:
+    """Replace the keyboard module, whose global hooks need root on Linux."""
+    sys.modules.setdefault("keyboard", types.SimpleNamespace(
+        add_hotkey=lambda *args, **kwargs: None
+    ))
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[float, float]:
+    """Run a function once, returning milliseconds and peak traced KiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+def write_synthetic_config(directory: Path, count: int) -> None:
+    """Write a catalog and layout of `count` tiles into a directory."""
+    entries = [{"key": f"tile{i}", "label": f"Tile {i}", "logo": "🚀",
+                "url": f"https://example.com/{i}"} for i in range(count)]
+    (directory / "entries.json").write_text(json.dumps(entries), encoding="utf-8")
+    (directory / "layout.json").write_text(
+        json.dumps(synthetic_layout(count).to_list()), encoding="utf-8")
+
+
+def bench_hot_paths(sizes=HOT_PATH_SIZES) -> Results:
+    """Time the launcher hot paths on synthetic layouts."""
+    ensure_display()
+    stub_keyboard()
+    from config import Config
+    from utilities import Analytics
+
+    results: Results = {}
+    cwd = os.getcwd()
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                write_synthetic_config(Path(directory), size)
+                config = Config()
+                layout = config.load_layout()
+                results[f"load_layout/{size}"] = measure(config.load_layout)
+                layout.swap("tile0", f"tile{size - 1}")
+                results[f"save_layout/{size}"] = measure(
+                    lambda: config.save_layout(layout, immediate=True))
+
+                analytics = Analytics()
+                results[f"track_button_click/{size}"] = measure(
+                    lambda: [analytics.track_button_click(f"Tile {i}") for i in range(size)])
+                analytics.close()
+
+                results.update(bench_app(size))
+            finally:
+                os.chdir(cwd)
+    return results
+
+
+def bench_app(size: int) -> Results:
+    """Time tile creation, layout refresh, a simulated drag and a theme switch in a live AppLauncher."""
+    import launcher
+    from config import Config
+
+    class BenchConfig(Config):
+        """Config that keeps every tile on the regular grid and watches no files."""
+
+        def __init__(self):
+            super().__init__()
+            self.SETTINGS["virtual_grid_threshold"] = sys.maxsize
+            self.SETTINGS["confirm_on_exit"] = False
+            self.SETTINGS["watch_files"] = False
+
+    launcher.Config = BenchConfig
+    app = launcher.AppLauncher()
+    # Tiles are built by the timed create_buttons call instead
+    app.pending_tiles = []
+    app.root.update()
+    results: Results = {}
+    try:
+        results[f"create_buttons/{size}"] = measure(
+            lambda: (app.create_buttons(), app.root.update_idletasks()))
+
+        # Reverse the layout so every tile moves
+        entries = app.button_layout.to_list()
+        cells = [(row, col) for _, row, col in entries]
+        shuffled = Layout.from_list([(key, *cell) for (key, _, _), cell
+                                     in zip(entries, reversed(cells))])
+        results[f"refresh_layout/{size}"] = measure(
+            lambda: (app.reconcile_layout(shuffled), app.root.update_idletasks()))
+
+        app.root.update()
+        results[f"drag/{size}"] = measure(lambda: simulate_drag(app))
+        results[f"theme_switch/{size}"] = measure(
+            lambda: (app.switch_theme("light"), app.root.update_idletasks()))
+    finally:
+        if app.watcher:
+            app.watcher.stop()
+        app.launcher.shutdown()
+        if app.bridge:
+            app.bridge.stop()
+        app.analytics.close()
+        app.root.destroy()
+    return results
+
+
+def simulate_drag(app: Any) -> None:
+    """Drag the first tile across the grid and drop it on the last one."""
+    keys = app.button_layout.keys()
+    source, target = app.widgets[keys[0]], app.widgets[keys[-1]]
+    x0, y0 = source.winfo_rootx() + 5, source.winfo_rooty() + 5
+    x1 = target.winfo_rootx() + target.winfo_width() // 2
+    y1 = target.winfo_rooty() + target.winfo_height() // 2
+
+    def event(x: int, y: int) -> types.SimpleNamespace:
+        return types.SimpleNamespace(widget=source, x_root=x, y_root=y)
+
+    app.drag_manager.start_drag(event(x0, y0), source)
+    for i in range(1, DRAG_MOTION_EVENTS + 1):
+        app.on_drag_motion(event(x0 + (x1 - x0) * i // DRAG_MOTION_EVENTS,
+                                 y0 + (y1 - y0) * i // DRAG_MOTION_EVENTS))
+        if i % 8 == 0:
+            # Roughly one rendered frame per eight motion events
+            app.render_drag_frame()
+    app.on_drop(event(x1, y1))
+    app.root.update_idletasks()
+
+
+def compare_with_baseline(results: Results, baseline: Results,
+                          threshold: float) -> list:
+    """Print results beside the baseline and return the regressed operations."""
+    regressions = []
+    print(f"{'operation':<26} {'ms':>9} {'baseline':>9} {'change':>8} {'peak KiB':>9}")
+    for name, (ms, peak) in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<26} {ms:>9.2f} {'-':>9} {'-':>8} {peak:>9.0f}")
+            continue
+        change = (ms - base[0]) / base[0] if base[0] else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<26} {ms:>9.2f} {base[0]:>9.2f} {change:>+8.0%} {peak:>9.0f}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def bench_virtual_grid(sizes=(100, 1000, 10000)) -> None:
+    """Show that the virtual grid keeps widget count and memory flat."""
+    import customtkinter as ctk
+    from catalog import Entry
+    from config import Config
+    from gui import LauncherButton, VirtualGrid
+
+    ensure_display()
+    theme = Config().THEMES["dark"]
+    root = ctk.CTk()
+    root.geometry("600x650")
+    print(f"{'tiles':>8} {'build ms':>10} {'scroll ms':>10} {'widgets':>8} {'peak KiB':>9}")
+    for size in sizes:
+        layout = synthetic_layout(size)
+        tracemalloc.start()
+        start = time.perf_counter()
+        grid = VirtualGrid(
+            root, layout,
+            lambda key: Entry(key, key, "🚀", "https://example.com"),
+            lambda parent: LauncherButton(parent, None, None, theme)
+        )
+        grid.pack(fill="both", expand=True)
+        root.update()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        grid.scroll_to(grid.total_rows // 2)
+        root.update()
+        scroll_ms = (time.perf_counter() - start) * 1000
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{size:>8} {build_ms:>10.1f} {scroll_ms:>10.1f} "
+              f"{count_widgets(grid):>8} {peak / 1024:>9.0f}")
+        grid.destroy()
+    root.destroy()
+
+
+def bench_search(sizes=(1000, 5000, 20000), queries: int = 500) -> None:
+    """Measure search index build time and query latency by query length.
+
+    Popularity goes through the launcher's own analytics-backed click
+    lookup. Empty queries are what the palette issues every time it opens,
+    and "click" is re-ranking one entry followed by such a query.
+    """
+    import random
+    import statistics
+    from catalog import Catalog, Entry
+    from launcher import AppLauncher
+    from search import SearchIndex
+
+    rng = random.Random(42)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choices(letters, k=rng.randint(4, 9))) for _ in range(2000)]
+    print(f"{'entries':>8} {'build ms':>10} {'query':>7} {'median us':>10} {'p99 us':>8}")
+    for size in sizes:
+        entries = [Entry(f"entry{i}", f"{rng.choice(words)} {rng.choice(words)}", "🔗",
+                         f"https://{rng.choice(words)}.com/{rng.choice(words)}")
+                   for i in range(size)]
+        analytics = types.SimpleNamespace(
+            data={"button_clicks": {entry.label: rng.randint(0, 500)
+                                    for entry in rng.sample(entries, size // 2)}},
+            revision=1)
+        app = types.SimpleNamespace(config=types.SimpleNamespace(catalog=Catalog(entries)),
+                                    analytics=analytics)
+        index = SearchIndex(lambda key: AppLauncher.click_count(app, key),
+                            lambda: analytics.revision)
+        start = time.perf_counter()
+        for entry in entries:
+            index.add(entry.key, entry.label, entry.target)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        cases = {"empty": lambda word: "",
+                 "1-2": lambda word: word[:rng.randint(1, 2)],
+                 "3+": lambda word: word[:rng.randint(3, len(word))]}
+        for name, make_query in cases.items():
+            latencies = []
+            for _ in range(queries):
+                query = make_query(rng.choice(words))
+                start = time.perf_counter()
+                index.search(query)
+                latencies.append((time.perf_counter() - start) * 1e6)
+            latencies.sort()
+            print(f"{size:>8} {build_ms:>10.1f} {name:>7} "
+                  f"{statistics.median(latencies):>10.1f} "
+                  f"{latencies[int(len(latencies) * 0.99)]:>8.1f}")
+
+        # A click moves one entry in the cached ranking instead of re-sorting it
+        latencies = []
+        for entry in rng.sample(entries, min(queries, size)):
+            clicks = analytics.data["button_clicks"]
+            clicks[entry.label] = clicks.get(entry.label, 0) + 1
+            analytics.revision += 1
+            start = time.perf_counter()
+            index.touch(entry.key)
+            index.search("")
+            latencies.append((time.perf_counter() - start) * 1e6)
+        latencies.sort()
+        print(f"{size:>8} {build_ms:>10.1f} {'click':>7} "
+              f"{statistics.median(latencies):>10.1f} "
+              f"{latencies[int(len(latencies) * 0.99)]:>8.1f}")
+
+
+def bench_ui_latency(samples: int = 200, workers: int = 32) -> None:
+    """Measure Tk event delay while background coroutines do file I/O."""
+    import asyncio
+    import tempfile
+    import customtkinter as ctk
+    from async_bridge import AsyncBridge, summarize_latency
+
+    ensure_display()
+    root = ctk.CTk()
+    root.withdraw()
+    bridge = AsyncBridge(root)
+    bridge.start()
+    results = {}
+    tasks = {}
+
+    def write_files(directory: str, worker: int) -> None:
+        for i in range(20):
+            with open(f"{directory}/{worker}-{i}.json", "w") as f:
+                f.write("x" * 65536)
+
+    async def background_io(directory: str) -> None:
+        while True:
+            await asyncio.gather(*(bridge.run_blocking(write_files, directory, worker)
+                                   for worker in range(workers)))
+
+    def loaded(delays):
+        results["loaded"] = delays
+        tasks["io"].cancel()
+        root.quit()
+
+    def idle(delays):
+        results["idle"] = delays
+        tasks["io"] = bridge.submit(background_io(directory))
+        bridge.measure_ui_latency(loaded, samples)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bridge.measure_ui_latency(idle, samples)
+        root.mainloop()
+        bridge.stop()
+    root.destroy()
+    for name, delays in results.items():
+        print(f"{name:>7}: {summarize_latency(delays)}")
+
+
+def bench_logging(calls: int = 20000) -> None:
+    """Measure the caller-side cost of a log call, synchronous versus queued."""
+    import logging
+    from logging.handlers import QueueListener, RotatingFileHandler
+    from queue import SimpleQueue
+    from utilities import DeferredQueueHandler, log_format
+
+    def per_call_us(log: logging.Logger, message: str) -> float:
+        start = time.perf_counter()
+        for i in range(calls):
+            log.info(message, i, "https://example.com")
+        return (time.perf_counter() - start) * 1e6 / calls
+
+    with tempfile.TemporaryDirectory() as directory:
+        sync_handler = logging.FileHandler(os.path.join(directory, "sync.log"))
+        sync_handler.setFormatter(log_format)
+        sync_log = logging.getLogger("bench.sync")
+        sync_log.addHandler(sync_handler)
+        sync_log.setLevel(logging.INFO)
+        sync_log.propagate = False
+
+        file_handler = RotatingFileHandler(os.path.join(directory, "queued.log"),
+                                           maxBytes=1024 * 1024, backupCount=3)
+        file_handler.setFormatter(log_format)
+        log_queue = SimpleQueue()
+        listener = QueueListener(log_queue, file_handler)
+        queued_log = logging.getLogger("bench.queued")
+        queued_log.addHandler(DeferredQueueHandler(log_queue))
+        queued_log.setLevel(logging.INFO)
+        queued_log.propagate = False
+
+        sync_us = per_call_us(sync_log, "Opened %s: %s")
+        # The listener starts afterwards: in the app log calls are sparse, so
+        # the UI thread rarely competes with the listener for the GIL
+        queued_us = per_call_us(queued_log, "Opened %s: %s")
+        start = time.perf_counter()
+        listener.start()
+        listener.stop()
+        drain_ms = (time.perf_counter() - start) * 1000
+        sync_handler.close()
+        file_handler.close()
+
+        # Disabled levels: an f-string is built anyway, %-style args are not
+        start = time.perf_counter()
+        for i in range(calls):
+            queued_log.debug(f"Probe of {i} failed: {'timeout'}")
+        fstring_us = (time.perf_counter() - start) * 1e6 / calls
+        start = time.perf_counter()
+        for i in range(calls):
+            queued_log.debug("Probe of %s failed: %s", i, "timeout")
+        lazy_us = (time.perf_counter() - start) * 1e6 / calls
+
+    print(f"synchronous file handler  {sync_us:6.2f} us/call")
+    print(f"queued, deferred format   {queued_us:6.2f} us/call "
+          f"(listener drained the backlog in {drain_ms:.0f} ms)")
+    print(f"disabled level, f-string  {fstring_us:6.2f} us/call")
+    print(f"disabled level, %-style   {lazy_us:6.2f} us/call")
+
+
+def bench_instance(runs: int = 10) -> None:
+    """Compare a cold start with handing a command to a running instance."""
+    import statistics
+    from instance import send
+
+    ensure_display()
+    script = str(Path(__file__).parent / "launcher.py")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "launcher.sock")
+        env = dict(os.environ, APP_LAUNCHER_SOCKET=path)
+        start = time.perf_counter()
+        daemon = subprocess.Popen([sys.executable, script, "--daemon"], cwd=directory,
+                                  env=env, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL)
+        # The socket is claimed before the window is built and commands are
+        # held until then, so wait for an unknown key to be rejected
+        while send(["launch", "\x00"], path) in (None, "ok"):
+            if daemon.poll() is not None:
+                raise SystemExit("launcher exited during startup")
+            time.sleep(0.005)
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        warm = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script, "show"], cwd=directory, env=env,
+                           check=True)
+            warm.append((time.perf_counter() - start) * 1000)
+        send(["quit"], path)
+        daemon.wait(timeout=10)
+
+    print(f"cold start until accepting commands  {cold_ms:8.1f} ms")
+    print(f"warm 'show' invocation (median)      {statistics.median(warm):8.1f} ms "
+          f"over {runs} runs")
+
+
+def bench_analytics(events: int = 1_000_000, buttons: int = 200,
+                    days: int = 30) -> None:
+    """Measure rollup ingest and top-N queries over synthetic click events."""
+    import random
+    from utilities import Analytics
+
+    rng = random.Random(42)
+    now = time.time()
+    # Skewed popularity so the top ten is well defined
+    keys = [f"Tile {i}" for i in range(buttons)]
+    weights = [1 / (rank + 1) for rank in range(buttons)]
+    picked = rng.choices(keys, weights, k=events)
+    stamps = sorted(now - rng.random() * days * 86400 for _ in range(events))
+    raw = [("click", key, "0", f"{stamp:.0f}", f"session{int(stamp // 3600)}")
+           for key, stamp in zip(picked, stamps)]
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            analytics = Analytics()
+            analytics._loaded.wait()
+            start = time.perf_counter()
+            with analytics._lock:
+                for event in raw:
+                    analytics._apply_event(analytics.data, event)
+            ingest_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(100):
+                top = analytics.top_buttons(days=7, limit=10)
+            query_us = (time.perf_counter() - start) * 1e6 / 100
+
+            # The same query answered by scanning the raw events
+            start = time.perf_counter()
+            since = (now // 86400 - 6) * 86400
+            totals: Dict[str, int] = {}
+            for event in raw:
+                if float(event[3]) >= since:
+                    totals[event[1]] = totals.get(event[1], 0) + 1
+            scan_ms = (time.perf_counter() - start) * 1000
+            assert [count for _, count in top] == sorted(totals.values(), reverse=True)[:10]
+
+            # The flusher's copy holds every logged event, as after a real flush
+            analytics._saved = copy.deepcopy(analytics.data)
+            compactor = threading.Thread(target=analytics.flush, kwargs={"compact": True})
+            start = time.perf_counter()
+            compactor.start()
+            click_ms = 0.0
+            while compactor.is_alive():
+                click_start = time.perf_counter()
+                analytics.track_button_click("Tile 0")
+                click_ms = max(click_ms, (time.perf_counter() - click_start) * 1000)
+                time.sleep(0.001)
+            compactor.join()
+            compact_ms = (time.perf_counter() - start) * 1000
+            size_kib = os.path.getsize("analytics.json") / 1024
+            rows = analytics.export(Path("export.csv"))
+            analytics.close()
+        finally:
+            os.chdir(cwd)
+
+    print(f"ingest      {events / ingest_s:12,.0f} events/s ({ingest_s:.1f} s for {events:,})")
+    print(f"top 10 / 7d {query_us:12.1f} us from rollups, {scan_ms:.0f} ms scanning raw events")
+    print(f"compaction  {compact_ms:12.1f} ms, analytics.json {size_kib:.0f} KiB, "
+          f"{rows:,} export rows")
+    print(f"click       {click_ms:12.3f} ms at most while compacting")
+
+
+BENCHMARKS: Dict[str, Callable[[], Optional[Results]]] = {
+    "hot_paths": bench_hot_paths,
+    "virtual_grid": bench_virtual_grid,
+    "search": bench_search,
+    "ui_latency": bench_ui_latency,
+    "logging": bench_logging,
+    "instance": bench_instance,
+    "analytics": bench_analytics,
+}
+
+
+def main() -> int:
+    """Run the selected benchmarks and check results against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown before flagging a regression (default 0.2)")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    baseline = {}
+    if BASELINE_FILE.exists():
+        baseline = {name: tuple(value) for name, value
+                    in json.loads(BASELINE_FILE.read_text()).items()}
+
+    regressions, unchecked = [], []
+    for name in args.names or BENCHMARKS:
+        print(f"== {name}")
+        results = BENCHMARKS[name]()
+        if not results:
+            continue
+        regressions += compare_with_baseline(results, baseline, args.threshold)
+        unchecked += [operation for operation in results if operation not in baseline]
+        baseline.update(results)
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline saved to {BASELINE_FILE.name}")
+        return 0
+    if unchecked:
+        print(f"NO BASELINE in {BASELINE_FILE.name} for: {', '.join(unchecked)}\n"
+              "These operations were not checked for regressions; "
+              "run with --save-baseline on a reference machine to record them.",
+              file=sys.stderr)
+    if regressions:
+        print(f"Regressed beyond {args.threshold:.0%}: {', '.join(regressions)}",
+              file=sys.stderr)
+    return 1 if regressions or unchecked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
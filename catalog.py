@@ -0,0 +1,129 @@
+"""Launcher entry catalog for the launcher application."""
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+FIELDS = ("key", "label", "logo", "url", "command", "single_instance")
+REQUIRED_FIELDS = ("key", "label", "logo")
+CACHE_VERSION = 2
+
+
+class Entry:
+    """A single launcher entry, opening either a URL or a local command."""
+
+    __slots__ = FIELDS
+
+    def __init__(self, key: str, label: str, logo: str, url: str = "",
+                 command: Sequence[str] = (), single_instance: bool = False):
+        """Initialize the entry."""
+        self.key = key
+        self.label = label
+        self.logo = logo
+        self.url = url
+        self.command = tuple(command)
+        self.single_instance = single_instance
+
+    @property
+    def target(self) -> str:
+        """The URL or program this entry opens."""
+        return self.command[0] if self.command else self.url
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """Field values in `FIELDS` order."""
+        return (self.key, self.label, self.logo, self.url, self.command,
+                self.single_instance)
+
+    def __eq__(self, other: object) -> bool:
+        """Entries are equal when all of their fields are."""
+        return isinstance(other, Entry) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"Entry(key={self.key!r}, label={self.label!r}, target={self.target!r})"
+
+
+class Catalog:
+    """Entries keyed by their layout key."""
+
+    def __init__(self, entries: Sequence[Entry] = ()):
+        """Initialize the catalog from entries."""
+        self._entries: Dict[str, Entry] = {entry.key: entry for entry in entries}
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Entry]:
+        """Iterate over entries in file order."""
+        return iter(self._entries.values())
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key has an entry."""
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Entry]:
+        """Return the entry for a key, or None if there is none."""
+        return self._entries.get(key)
+
+    @staticmethod
+    def validate(rows: Any) -> List[Entry]:
+        """Check parsed catalog rows and turn them into entries."""
+        if not isinstance(rows, list):
+            raise ValueError("catalog must be a list of entries")
+        entries, seen, errors = [], set(), []
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors.append(f"entry {i} is not an object")
+                continue
+            missing = [field for field in REQUIRED_FIELDS
+                       if not isinstance(row.get(field), str) or not row[field]]
+            if missing:
+                errors.append(f"entry {i} is missing {', '.join(missing)}")
+                continue
+            url, command = row.get("url", ""), row.get("command", [])
+            if not isinstance(url, str) or not isinstance(command, list) \
+                    or not all(isinstance(part, str) and part for part in command):
+                errors.append(f"entry {i} has an invalid url or command")
+                continue
+            if bool(url) == bool(command):
+                errors.append(f"entry {i} needs exactly one of url or command")
+                continue
+            if not isinstance(row.get("single_instance", False), bool):
+                errors.append(f"entry {i} has a non-boolean single_instance")
+                continue
+            if row["key"] in seen:
+                errors.append(f"entry {i} repeats key {row['key']!r}")
+                continue
+            seen.add(row["key"])
+            entries.append(Entry(row["key"], row["label"], row["logo"], url, command,
+                                 row.get("single_instance", False)))
+        if errors:
+            raise ValueError("; ".join(errors))
+        return entries
+
+    @classmethod
+    def load(cls, path: Path, cache_path: Path) -> "Catalog":
+        """Load a catalog file, reusing the pre-parsed cache while the file is unchanged."""
+        stat = os.stat(path)
+        stamp = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_stamp, rows = pickle.load(f)
+            if cached_stamp == stamp:
+                return cls([Entry(*row) for row in rows])
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
+
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = cls.validate(json.load(f))
+        try:
+            tmp_file = cache_path.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((stamp, [entry.as_tuple() for entry in entries]), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_path)
+        except OSError as e:
+            print(f"Error caching catalog: {e}")
+        return cls(entries)
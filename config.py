@@ -1,56 +1,63 @@
 """Configuration management for the launcher application."""
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Dict, Any, Optional
 from pathlib import Path
 import json
+import os
+import threading
+from catalog import Catalog, Entry
+from layout import Layout
+from metrics import metrics
+
+# Entries used when entries.json is missing or invalid
+DEFAULT_ENTRIES = [
+    Entry("ChatGPT", "ChatGPT", "🤖", "https://chat.openai.com"),
+    Entry("Gmail", "Gmail", "📧", "https://mail.google.com"),
+    Entry("YouTube", "YouTube", "▶️", "https://www.youtube.com"),
+    Entry("GitHub", "GitHub", "🐱", "https://github.com"),
+    Entry("Reddit", "Reddit", "🌐", "https://reddit.com"),
+]
 
 class Config:
     """Manages application configuration and settings."""
     
+    SAVE_DELAY = 0.5
+    
     def __init__(self):
         """Initialize configuration with default values."""
-        self.URLS = {
-            "ChatGPT": "https://chat.openai.com",
-            "Gmail": "https://mail.google.com",
-            "YouTube": "https://www.youtube.com",
-            "GitHub": "https://github.com",
-            "Reddit": "https://reddit.com"
-        }
-        
-        self.BUTTON_LOGOS = {
-            "ChatGPT": "🤖",
-            "Gmail": "📧",
-            "YouTube": "▶️",
-            "GitHub": "🐱",
-            "Reddit": "🌐"
-        }
-        
-        self.LABEL_TEXT = {
-            "ChatGPT": "ChatGPT",
-            "Gmail": "Gmail",
-            "YouTube": "YouTube",
-            "GitHub": "GitHub",
-            "Reddit": "Reddit"
-        }
+        self._catalog_file = Path("entries.json")
+        self._catalog_cache = Path("entries.cache")
+        self.catalog = self.load_catalog()
         
         self.THEMES = {
             "dark": {
                 "bg_color": "black",
                 "button_color": "#282828",
                 "hover_color": "#3a3a3a",
-                "highlight_color": "#4a4a4a"
+                "highlight_color": "#4a4a4a",
+                "text_color": "white",
+                "muted_text_color": "gray",
+                "active_color": "green"
             },
             "light": {
                 "bg_color": "white",
                 "button_color": "#e0e0e0",
                 "hover_color": "#d0d0d0",
-                "highlight_color": "#c0c0c0"
+                "highlight_color": "#c0c0c0",
+                "text_color": "black",
+                "muted_text_color": "#606060",
+                "active_color": "#2e8b57"
             }
         }
         
         self.SETTINGS = {
             "confirm_on_exit": True,
+            "theme": "dark",
             "enable_analytics": True,
-            "show_tooltips": True
+            "show_tooltips": True,
+            "enable_warmup": False,
+            "enable_status_probes": False,
+            "virtual_grid_threshold": 60,
+            "watch_files": True
         }
         
         self._layout_file = Path("layout.json")
@@ -59,25 +66,110 @@ class Config:
             ("GitHub", 1, 0), ("Reddit", 1, 1), (None, 1, 2),
             (None, 2, 0), (None, 2, 1), (None, 2, 2)
         ]
+        
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_layout = None
+        self._save_timer = None
+        self._last_saved = None
 
-    def load_layout(self) -> List[Tuple[Optional[str], int, int]]:
-        """Load button layout from file or return default layout."""
+    @property
+    def catalog_file(self) -> Path:
+        """Path of the entry catalog."""
+        return self._catalog_file
+
+    @property
+    def layout_file(self) -> Path:
+        """Path of the saved layout."""
+        return self._layout_file
+
+    def read_catalog(self) -> Catalog:
+        """Load launcher entries from file, raising if the file is invalid."""
+        if self._catalog_file.exists():
+            return Catalog.load(self._catalog_file, self._catalog_cache)
+        return Catalog(DEFAULT_ENTRIES)
+
+    def load_catalog(self) -> Catalog:
+        """Load launcher entries from file or return the default entries."""
         try:
-            if self._layout_file.exists():
-                with open(self._layout_file, 'r') as f:
-                    return json.load(f)
-            return self._default_layout
+            return self.read_catalog()
         except Exception as e:
-            print(f"Error loading layout: {e}")
-            return self._default_layout
+            print(f"Error loading catalog: {e}")
+            return Catalog(DEFAULT_ENTRIES)
+
+    def read_layout(self) -> Layout:
+        """Load button layout from file, raising if the file is invalid."""
+        if self._layout_file.exists():
+            with metrics.timer("layout_load"), open(self._layout_file, 'r') as f:
+                entries = json.load(f)
+            layout = Layout.from_list(entries)
+            self._last_saved = json.dumps(layout.to_list())
+            return layout
+        return Layout.from_list(self._default_layout)
 
-    def save_layout(self, layout: List[Tuple[Optional[str], int, int]]) -> None:
-        """Save button layout to file."""
+    def load_layout(self) -> Layout:
+        """Load button layout from file or return default layout."""
         try:
-            with open(self._layout_file, 'w') as f:
-                json.dump(layout, f)
+            return self.read_layout()
         except Exception as e:
-            print(f"Error saving layout: {e}")
+            print(f"Error loading layout: {e}")
+            return Layout.from_list(self._default_layout)
+
+    def parse_layout(self, text: str) -> Optional[Layout]:
+        """Parse layout file contents changed on disk, or None if they match the last save.
+
+        The launcher's own writes, and rewrites that only change formatting,
+        come back as None.
+        """
+        with self._write_lock:
+            if text == self._last_saved:
+                return None
+            layout = Layout.from_list(json.loads(text))
+            serialized = json.dumps(layout.to_list())
+            if serialized == self._last_saved:
+                return None
+            self._last_saved = serialized
+            return layout
+
+    def save_layout(self, layout: Layout, immediate: bool = False) -> None:
+        """Schedule the layout to be saved, coalescing bursts of changes."""
+        with self._save_lock:
+            self._pending_layout = layout.to_list()
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not immediate:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush_layout)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        if immediate:
+            self.flush_layout()
+
+    def flush_layout(self) -> None:
+        """Write the pending layout to file if it changed since the last write."""
+        with self._save_lock:
+            layout, self._pending_layout = self._pending_layout, None
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        if layout is None:
+            return
+        
+        with self._write_lock:
+            serialized = json.dumps(layout)
+            if serialized == self._last_saved:
+                return
+            tmp_file = self._layout_file.with_suffix('.json.tmp')
+            try:
+                with metrics.timer("layout_save"):
+                    with open(tmp_file, 'w') as f:
+                        f.write(serialized)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_file, self._layout_file)
+                self._last_saved = serialized
+            except Exception as e:
+                print(f"Error saving layout: {e}")
 
     def update_settings(self, settings: Dict[str, Any]) -> None:
         """Update application settings."""
@@ -85,4 +177,5 @@ class Config:
 
     def get_url(self, key: str) -> str:
         """Get URL for a given key."""
-        return self.URLS.get(key, "")
+        entry = self.catalog.get(key)
+        return entry.url if entry else ""
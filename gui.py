@@ -1,25 +1,40 @@
 """GUI components for the launcher application."""
-from typing import Dict, Any, Optional, Callable
+import math
+from bisect import bisect_right
+from typing import Dict, Any, Optional, Callable, Iterable, List, Tuple
 import customtkinter as ctk
+from icons import is_image_path
+from metrics import metrics
 from utilities import open_link, logger
 
 class LauncherButton(ctk.CTkFrame):
     """Custom button widget for the launcher application."""
     
-    def __init__(self, parent: any, logo: str, label: str, url: str,
-                 status_label: ctk.CTkLabel, theme: Dict[str, str],
-                 analytics: Optional[Any] = None):
-        """Initialize the button widget."""
+    STATUS_COLORS = {"up": "#3ba55d", "down": "#ed4245"}
+    ICON_SIZE = 56
+    
+    def __init__(self, parent: any, entry: Optional[Any],
+                 status_label: ctk.CTkLabel, theme: Dict[str, Any],
+                 analytics: Optional[Any] = None,
+                 launcher: Optional[Any] = None,
+                 icons: Optional[Any] = None):
+        """Initialize the button widget, optionally without an entry yet."""
         super().__init__(parent, fg_color="transparent")
         
-        self.url = url
+        self.entry = entry
         self.analytics = analytics
-        self.key = label
+        self.launcher = launcher
+        self.icons = icons
+        self.key = entry.label if entry else ""
+        self.badge: Optional[ctk.CTkLabel] = None
+        self.status: Optional[str] = None
         
         # Create button
+        text, image = self._logo(entry) if entry else ("", None)
         self.button = ctk.CTkButton(
             self,
-            text=logo,
+            text=text,
+            image=image,
             font=("Segoe UI Emoji", 40),
             corner_radius=20,
             fg_color=theme["button_color"],
@@ -32,17 +47,60 @@ class LauncherButton(ctk.CTkFrame):
         # Create label
         self.label = ctk.CTkLabel(
             self,
-            text=label,
+            text=self.key,
             font=("Segoe UI", 14, "bold"),
-            text_color="white"
+            text_color=theme["text_color"]
         )
         self.label.pack(padx=5, pady=(0, 5))
 
+    def bind_entry(self, entry: Any) -> None:
+        """Show a different entry in this button, reusing its widgets."""
+        text, image = self._logo(entry)
+        self.button.configure(text=text, image=image)
+        self.label.configure(text=entry.label)
+        self.entry = entry
+        self.key = entry.label
+        self.set_status(None)
+
+    def _logo(self, entry: Any) -> Tuple[str, Optional[Any]]:
+        """Button text and image for an entry's logo.
+
+        Uses the cached rendering when there is one; otherwise the glyph
+        is drawn as text, or the label's initial stands in for an image file.
+        """
+        image = self.icons.get(entry.logo, self.ICON_SIZE) if self.icons else None
+        if image is not None:
+            return "", image
+        if is_image_path(entry.logo):
+            return entry.label[:1].upper(), None
+        return entry.logo, None
+
+    def set_status(self, status: Optional[str]) -> None:
+        """Show a reachability badge, or hide it when the status is unknown."""
+        if status == self.status:
+            return
+        self.status = status
+        if status is None:
+            if self.badge is not None:
+                self.badge.place_forget()
+            return
+        if self.badge is None:
+            self.badge = ctk.CTkLabel(self, text="●", font=("Segoe UI", 14),
+                                      width=14, height=14, fg_color="transparent")
+        self.badge.configure(text_color=self.STATUS_COLORS.get(status, "gray"))
+        self.badge.place(relx=1.0, x=-16, y=8, anchor="ne")
+
     def _handle_click(self, status_label: ctk.CTkLabel) -> None:
         """Handle button click event."""
-        open_link(self.url, status_label)
-        if self.analytics:
-            self.analytics.track_button_click(self.key)
+        if self.entry is None:
+            return
+        with metrics.timer("click"):
+            if self.launcher:
+                self.launcher.submit(self.entry, status_label)
+            else:
+                open_link(self.entry.url, status_label)
+            if self.analytics:
+                self.analytics.track_button_click(self.key)
 
     def set_drag_bindings(self, start_fn: Callable, motion_fn: Callable,
                          end_fn: Callable) -> None:
@@ -54,15 +112,209 @@ class LauncherButton(ctk.CTkFrame):
             widget.bind("<ButtonRelease-1>", end_fn)
 
 
+class VirtualGrid(ctk.CTkFrame):
+    """Scrollable tile grid that only materializes the rows in view.
+    
+    A fixed pool of tiles, one row per visible grid row, is rebound to
+    different layout entries as the user scrolls.
+    """
+    
+    def __init__(self, parent: any, layout: Any,
+                 resolve: Callable[[str], Optional[Any]],
+                 make_tile: Callable[[Any], LauncherButton],
+                 row_height: int = 150, fg_color: str = "black"):
+        """Initialize the grid with an empty tile pool."""
+        super().__init__(parent, fg_color=fg_color)
+        self.layout = layout
+        self.resolve = resolve
+        self.make_tile = make_tile
+        self.row_height = row_height
+        self.total_rows = layout.rows
+        self.first_row = 0
+        self.tiles: List[List[LauncherButton]] = []
+        self.statuses: Dict[str, str] = {}
+        self._bound: Dict[LauncherButton, Optional[str]] = {}
+        
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        for col in range(max(layout.columns, 1)):
+            self.viewport.grid_columnconfigure(col, weight=1, uniform="tile")
+        
+        self.viewport.bind("<Configure>", self.on_resize)
+        self.bind_scroll(self.viewport)
+
+    @property
+    def visible_rows(self) -> int:
+        """Number of rows in the tile pool."""
+        return len(self.tiles)
+
+    def bind_scroll(self, widget: Any) -> None:
+        """Scroll the grid with the mouse wheel over a widget."""
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+
+    def on_resize(self, event: any) -> None:
+        """Grow or shrink the tile pool to fill the viewport."""
+        wanted = max(1, math.ceil(event.height / self.row_height))
+        columns = max(self.layout.columns, 1)
+        while len(self.tiles) < wanted:
+            row = len(self.tiles)
+            self.viewport.grid_rowconfigure(row, weight=1, uniform="tile")
+            tiles = []
+            for col in range(columns):
+                tile = self.make_tile(self.viewport)
+                tile.grid(row=row, column=col, sticky="nsew", padx=10, pady=10)
+                tile.grid_remove()
+                for widget in (tile, tile.button, tile.label):
+                    self.bind_scroll(widget)
+                self._bound[tile] = None
+                tiles.append(tile)
+            self.tiles.append(tiles)
+        while len(self.tiles) > wanted:
+            self.viewport.grid_rowconfigure(len(self.tiles) - 1, weight=0, uniform="")
+            for tile in self.tiles.pop():
+                del self._bound[tile]
+                tile.destroy()
+        self.scroll_to(self.first_row, force=True)
+
+    def on_scrollbar(self, action: str, *args: str) -> None:
+        """Handle scrollbar drags and clicks."""
+        if action == "moveto":
+            self.scroll_to(round(float(args[0]) * self.total_rows))
+        elif action == "scroll":
+            step = self.visible_rows if args[1] == "pages" else 1
+            self.scroll_to(self.first_row + int(args[0]) * step)
+
+    def on_wheel(self, event: any) -> None:
+        """Scroll one row per wheel notch."""
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.scroll_to(self.first_row + (-1 if up else 1))
+
+    def scroll_to(self, row: int, force: bool = False) -> int:
+        """Show the layout starting at a row, returning the tiles rebound."""
+        row = max(0, min(row, self.total_rows - self.visible_rows))
+        if row == self.first_row and not force:
+            return 0
+        self.first_row = row
+        return self.render()
+
+    def set_layout(self, layout: Any) -> int:
+        """Switch to a new layout, returning the tiles rebound."""
+        self.layout = layout
+        self.total_rows = layout.rows
+        return self.scroll_to(self.first_row, force=True)
+
+    def set_resolver(self, resolve: Callable[[str], Optional[Any]]) -> int:
+        """Look entries up with a new resolver and rebind every tile."""
+        self.resolve = resolve
+        for tile in self._bound:
+            self._bound[tile] = None
+        return self.render()
+
+    def set_statuses(self, statuses: Dict[str, str]) -> None:
+        """Update the reachability badges of the bound tiles."""
+        self.statuses.update(statuses)
+        for tile, key in self._bound.items():
+            if key is not None:
+                tile.set_status(self.statuses.get(key))
+
+    def render(self) -> int:
+        """Bind every pooled tile to the entry in its viewport cell."""
+        rebound = 0
+        for offset, tiles in enumerate(self.tiles):
+            for col, tile in enumerate(tiles):
+                key = self.layout.key_at(self.first_row + offset, col)
+                if key == self._bound[tile]:
+                    continue
+                entry = self.resolve(key) if key is not None else None
+                if entry is None:
+                    key = None
+                    tile.grid_remove()
+                else:
+                    if self._bound[tile] is None:
+                        tile.grid()
+                    tile.bind_entry(entry)
+                    tile.set_status(self.statuses.get(key))
+                self._bound[tile] = key
+                rebound += 1
+        
+        total = max(self.total_rows, 1)
+        self.scrollbar.set(self.first_row / total,
+                           min(1.0, (self.first_row + self.visible_rows) / total))
+        return rebound
+
+
+class GridIndex:
+    """Maps screen coordinates to grid cells from geometry captured once."""
+    
+    def __init__(self, widgets: Iterable[LauncherButton]):
+        """Snapshot the on-screen rectangle of every widget."""
+        self._cells: Dict[Tuple[int, int], Tuple[LauncherButton, int, int, int, int]] = {}
+        rows: Dict[int, Tuple[int, int]] = {}
+        cols: Dict[int, Tuple[int, int]] = {}
+        for widget in widgets:
+            info = widget.grid_info()
+            if not info:
+                continue
+            row, col = int(info["row"]), int(info["column"])
+            x0, y0 = widget.winfo_rootx(), widget.winfo_rooty()
+            x1, y1 = x0 + widget.winfo_width(), y0 + widget.winfo_height()
+            self._cells[(row, col)] = (widget, x0, y0, x1, y1)
+            rows[row] = (min(y0, rows.get(row, (y0, y1))[0]),
+                         max(y1, rows.get(row, (y0, y1))[1]))
+            cols[col] = (min(x0, cols.get(col, (x0, x1))[0]),
+                         max(x1, cols.get(col, (x0, x1))[1]))
+        self._row_tops, self._rows = self._edges(rows)
+        self._col_lefts, self._cols = self._edges(cols)
+
+    @staticmethod
+    def _edges(spans: Dict[int, Tuple[int, int]]) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Sort grid lines by their leading screen edge."""
+        ordered = sorted(spans.items(), key=lambda item: item[1][0])
+        return [span[0] for _, span in ordered], [(i, span[1]) for i, span in ordered]
+
+    @staticmethod
+    def _locate(edges: List[int], spans: List[Tuple[int, int]], pos: int) -> Optional[int]:
+        """Find the grid line whose span contains a screen position."""
+        i = bisect_right(edges, pos) - 1
+        if i < 0 or pos >= spans[i][1]:
+            return None
+        return spans[i][0]
+
+    def widget_at(self, x: int, y: int) -> Optional[LauncherButton]:
+        """Return the widget under a screen position, if any."""
+        row = self._locate(self._row_tops, self._rows, y)
+        col = self._locate(self._col_lefts, self._cols, x)
+        if row is None or col is None:
+            return None
+        cell = self._cells.get((row, col))
+        if cell is None:
+            return None
+        widget, x0, y0, x1, y1 = cell
+        if x0 < x < x1 and y0 < y < y1:
+            return widget
+        return None
+
+
 class DragDropManager:
     """Manages drag and drop operations for buttons."""
     
-    def __init__(self):
+    def __init__(self, widgets_provider: Optional[Callable[[], Iterable[LauncherButton]]] = None):
         """Initialize drag and drop manager."""
+        self.widgets_provider = widgets_provider
+        self.index: Optional[GridIndex] = None
+        self._ghost: Optional[ctk.CTkToplevel] = None
+        self._ghost_frame: Optional[ctk.CTkFrame] = None
         self.drag_data = {
             "widget": None,
             "ghost": None,
             "start_pos": (0, 0),
+            "pointer": None,
             "start_info": None
         }
 
@@ -74,24 +326,165 @@ class DragDropManager:
         self.drag_data["widget"] = widget
         self.drag_data["start_pos"] = (event.x_root, event.y_root)
         self.drag_data["start_info"] = widget.grid_info()
+        if self.widgets_provider:
+            self.index = GridIndex(self.widgets_provider())
         
         # Create ghost button
         ghost = self._create_ghost_button(event, widget)
         self.drag_data["ghost"] = ghost
         ghost.lift()  # Keep ghost on top
-        logger.debug(f"Started dragging widget at ({event.x_root}, {event.y_root})")
+        logger.debug("Started dragging widget at (%s, %s)", event.x_root, event.y_root)
+
+    def find_target(self, x: int, y: int) -> Optional[LauncherButton]:
+        """Find the drop target under a screen position."""
+        if self.index is None:
+            return None
+        target = self.index.widget_at(x, y)
+        if target is self.drag_data["widget"]:
+            return None
+        return target
 
     def _create_ghost_button(self, event: any, widget: LauncherButton) -> ctk.CTkToplevel:
-        """Create a ghost button for drag visualization."""
-        ghost = ctk.CTkToplevel()
-        ghost.overrideredirect(True)
-        ghost.attributes('-alpha', 0.5)
-        ghost.geometry(f"{widget.winfo_width()}x{widget.winfo_height()}")
+        """Show the pooled ghost button for drag visualization."""
+        if self._ghost is None or not self._ghost.winfo_exists():
+            self._ghost = ctk.CTkToplevel()
+            self._ghost.overrideredirect(True)
+            self._ghost.attributes('-alpha', 0.5)
+            self._ghost_frame = ctk.CTkFrame(self._ghost)
+            self._ghost_frame.pack(fill="both", expand=True)
         
-        # Create ghost content
-        frame = ctk.CTkFrame(ghost, fg_color=widget.cget("fg_color"))
-        frame.pack(fill="both", expand=True)
+        ghost = self._ghost
+        self._ghost_frame.configure(fg_color=widget.cget("fg_color"))
         
-        # Position ghost at cursor
-        ghost.geometry(f"+{event.x_root-30}+{event.y_root-30}")
+        # Size and position ghost at cursor
+        ghost.geometry(f"{widget.winfo_width()}x{widget.winfo_height()}"
+                       f"+{event.x_root-30}+{event.y_root-30}")
+        ghost.deiconify()
         return ghost
+
+    def release_ghost(self) -> None:
+        """Hide the ghost button so it can be reused by the next drag."""
+        if self.drag_data["ghost"]:
+            self.drag_data["ghost"].withdraw()
+            self.drag_data["ghost"] = None
+
+
+class MetricsOverlay(ctk.CTkFrame):
+    """Toggleable panel over the status bar showing live hot-path metrics."""
+    
+    REFRESH_MS = 1000
+    
+    def __init__(self, parent: any, metrics: Any,
+                 on_export: Callable[[], None]):
+        """Initialize the overlay hidden."""
+        super().__init__(parent, corner_radius=8)
+        self.metrics = metrics
+        self.refresh_job = None
+        self.text = ctk.CTkLabel(self, text="", font=("Consolas", 11),
+                                 justify="left", anchor="w")
+        self.text.pack(fill="both", expand=True, padx=10, pady=(8, 4))
+        ctk.CTkButton(self, text="Export JSON", width=100,
+                      command=on_export).pack(anchor="e", padx=10, pady=(0, 8))
+
+    @property
+    def visible(self) -> bool:
+        """Whether the overlay is shown."""
+        return self.refresh_job is not None
+
+    def toggle(self) -> None:
+        """Show or hide the overlay."""
+        if self.visible:
+            self.after_cancel(self.refresh_job)
+            self.refresh_job = None
+            self.place_forget()
+        else:
+            self.place(relx=0.0, rely=1.0, x=10, y=-50, anchor="sw")
+            self.lift()
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Redraw the metrics and schedule the next redraw."""
+        self.text.configure(text=self.metrics.report())
+        self.refresh_job = self.after(self.REFRESH_MS, self.refresh)
+
+
+class QuickLaunchPalette(ctk.CTkToplevel):
+    """Keyboard-driven quick-launch window over a search index."""
+    
+    MAX_RESULTS = 8
+    
+    def __init__(self, parent: any, index: Any, describe: Callable[[str], str],
+                 on_launch: Callable[[str], None], theme: Dict[str, Any]):
+        """Initialize the palette with a fixed pool of result rows."""
+        super().__init__(parent)
+        self.title("Quick Launch")
+        self.geometry("420x380")
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        
+        self.index = index
+        self.describe = describe
+        self.on_launch = on_launch
+        self.theme = theme
+        self.results: List[str] = []
+        self.selected = 0
+        
+        self.query = ctk.StringVar()
+        self.query.trace_add("write", lambda *_: self.refresh())
+        self.entry = ctk.CTkEntry(self, textvariable=self.query,
+                                  placeholder_text="Type to search...")
+        self.entry.pack(fill="x", padx=10, pady=10)
+        
+        self.rows = []
+        for i in range(self.MAX_RESULTS):
+            row = ctk.CTkButton(
+                self,
+                text="",
+                anchor="w",
+                fg_color="transparent",
+                hover_color=theme["hover_color"],
+                command=lambda i=i: self.launch(i)
+            )
+            row.pack(fill="x", padx=10, pady=1)
+            self.rows.append(row)
+        
+        self.bind("<Return>", lambda event: self.launch(self.selected))
+        self.bind("<Escape>", lambda event: self.withdraw())
+        self.bind("<Up>", lambda event: self.move_selection(-1))
+        self.bind("<Down>", lambda event: self.move_selection(1))
+
+    def show(self) -> None:
+        """Clear the query and bring the palette to the front."""
+        # Setting the query runs the search through its trace
+        self.query.set("")
+        self.deiconify()
+        self.lift()
+        self.entry.focus_set()
+
+    def refresh(self) -> None:
+        """Search for the current query."""
+        self.results = self.index.search(self.query.get(), self.MAX_RESULTS)
+        self.selected = 0
+        self.render()
+
+    def render(self) -> None:
+        """Show the current results in the row pool."""
+        for i, row in enumerate(self.rows):
+            if i < len(self.results):
+                color = self.theme["highlight_color"] if i == self.selected else "transparent"
+                row.configure(text=self.describe(self.results[i]), fg_color=color,
+                              state="normal")
+            else:
+                row.configure(text="", fg_color="transparent", state="disabled")
+
+    def move_selection(self, step: int) -> None:
+        """Move the highlighted result up or down."""
+        if self.results:
+            self.selected = (self.selected + step) % len(self.results)
+            self.render()
+
+    def launch(self, i: int) -> None:
+        """Launch a result and hide the palette."""
+        if i < len(self.results):
+            self.withdraw()
+            self.on_launch(self.results[i])
@@ -0,0 +1,189 @@
+"""Rendered icon cache for launcher tiles."""
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+from utilities import logger
+
+CACHE_VERSION = 2
+IMAGE_SUFFIXES = (".png", ".gif", ".jpg", ".jpeg", ".ico", ".bmp", ".webp")
+
+# Color emoji fonts by platform, most common first
+EMOJI_FONTS = (
+    "C:/Windows/Fonts/seguiemj.ttf",
+    "/System/Library/Fonts/Apple Color Emoji.ttc",
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf",
+)
+
+# Bitmap emoji fonts only load at the sizes their strikes were drawn at
+BITMAP_FONT_SIZES = (109, 160, 96, 64)
+
+def is_image_path(logo: str) -> bool:
+    """Whether a logo names an image file rather than a text glyph."""
+    return logo.lower().endswith(IMAGE_SUFFIXES)
+
+
+class IconCache:
+    """Renders each logo once into a CTkImage and keeps the result.
+
+    Images are keyed by logo, size and scale factor. Each one carries a
+    light and a dark variant, so customtkinter swaps them on a theme
+    switch without the logo being rendered or reconfigured again; only
+    glyphs from fonts without color glyphs differ between the two. The
+    most recently used images stay in memory and every rendering is also
+    kept as a PNG thumbnail in ``cache_dir`` so later starts skip
+    rasterizing. Pillow is optional; without it, or without an emoji
+    font, ``get`` returns None and tiles show the logo as text.
+    """
+
+    def __init__(self, cache_dir: Path = Path("icon_cache"), max_size: int = 256,
+                 scale: float = 1.0):
+        """Initialize an empty cache."""
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.scale = scale
+        self._images: OrderedDict = OrderedDict()
+        self._pil: Optional[Tuple[Any, ...]] = None
+        self._fonts: dict = {}
+        self._font_path: Optional[str] = None
+        self._checked = False
+
+    def __len__(self) -> int:
+        """Number of images held in memory."""
+        return len(self._images)
+
+    @property
+    def available(self) -> bool:
+        """Whether Pillow can be used to render icons."""
+        if not self._checked:
+            self._checked = True
+            try:
+                from PIL import Image, ImageChops, ImageDraw, ImageFont
+                self._pil = (Image, ImageDraw, ImageFont, ImageChops)
+            except ImportError:
+                logger.info("Pillow is not installed, showing logos as text")
+            self._font_path = next((path for path in EMOJI_FONTS
+                                    if os.path.exists(path)), None)
+        return self._pil is not None
+
+    def get(self, logo: str, size: int) -> Optional[Any]:
+        """Return the CTkImage for a logo at a display size in pixels, or None."""
+        key = (logo, size, self.scale)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        if not self.available:
+            return None
+
+        pixels = round(size * self.scale)
+        try:
+            picture = self._load_thumbnail(logo, pixels)
+        except Exception as e:
+            logger.warning("Could not render logo %r: %s", logo, e)
+            picture = None
+        if picture is None:
+            return None
+
+        light = picture if is_image_path(logo) else self._light_variant(picture)
+        import customtkinter as ctk
+        image = ctk.CTkImage(light_image=light, dark_image=picture, size=(size, size))
+        self._images[key] = image
+        while len(self._images) > self.max_size:
+            self._images.popitem(last=False)
+        return image
+
+    def clear(self) -> None:
+        """Drop the in-memory images, keeping the thumbnails on disk."""
+        self._images.clear()
+
+    def _thumbnail_path(self, logo: str, pixels: int) -> Optional[Path]:
+        """Thumbnail file for a rendering, or None if the logo cannot be rendered."""
+        if is_image_path(logo):
+            stat = os.stat(logo)
+            source = (logo, stat.st_mtime_ns, stat.st_size)
+        elif self._font_path is not None:
+            source = (logo, self._font_path)
+        else:
+            return None
+        digest = hashlib.sha1(repr((CACHE_VERSION, source, pixels)).encode()).hexdigest()
+        return self.cache_dir / f"{digest[:20]}.png"
+
+    def _load_thumbnail(self, logo: str, pixels: int) -> Optional[Any]:
+        """Load a cached thumbnail, rendering and storing it when missing."""
+        Image = self._pil[0]
+        path = self._thumbnail_path(logo, pixels)
+        if path is None:
+            return None
+        try:
+            with Image.open(path) as cached:
+                return cached.convert("RGBA")
+        except (OSError, ValueError):
+            pass
+
+        if is_image_path(logo):
+            with Image.open(logo) as source:
+                picture = source.convert("RGBA")
+        else:
+            picture = self._render_glyph(logo)
+        picture = self._fit(picture, pixels)
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_file = path.with_suffix('.tmp')
+            picture.save(tmp_file, format="PNG")
+            os.replace(tmp_file, path)
+        except OSError as e:
+            logger.warning("Could not cache icon thumbnail: %s", e)
+        return picture
+
+    def _font(self) -> Tuple[Any, int]:
+        """The emoji font and the size it was loaded at."""
+        if self._font_path not in self._fonts:
+            ImageFont = self._pil[2]
+            for size in (128,) + BITMAP_FONT_SIZES:
+                try:
+                    self._fonts[self._font_path] = (
+                        ImageFont.truetype(self._font_path, size), size)
+                    break
+                except OSError:
+                    continue
+            else:
+                raise OSError(f"cannot load {self._font_path}")
+        return self._fonts[self._font_path]
+
+    def _fit(self, picture: Any, pixels: int) -> Any:
+        """Shrink a picture into the middle of a transparent square."""
+        Image = self._pil[0]
+        picture.thumbnail((pixels, pixels), Image.LANCZOS)
+        square = Image.new("RGBA", (pixels, pixels), (0, 0, 0, 0))
+        square.paste(picture, ((pixels - picture.width) // 2,
+                               (pixels - picture.height) // 2))
+        return square
+
+    def _render_glyph(self, glyph: str) -> Any:
+        """Rasterize a text glyph at the font's size, trimmed to its ink."""
+        Image, ImageDraw = self._pil[:2]
+        font, font_size = self._font()
+        canvas = Image.new("RGBA", (font_size * 2, font_size * 2), (0, 0, 0, 0))
+        ImageDraw.Draw(canvas).text((font_size, font_size), glyph, font=font,
+                                    anchor="mm", embedded_color=True,
+                                    fill="white")
+        box = canvas.getbbox()
+        return canvas.crop(box) if box is not None else canvas
+
+    def _light_variant(self, picture: Any) -> Any:
+        """A rendered glyph as shown on light backgrounds.
+
+        Glyphs from fonts without color glyphs come out in shades of grey
+        and are redrawn in black; color emoji are used as they are.
+        """
+        Image, ImageChops = self._pil[0], self._pil[3]
+        red, green, blue, alpha = picture.split()
+        if ImageChops.difference(red, green).getbbox() is not None or \
+                ImageChops.difference(green, blue).getbbox() is not None:
+            return picture
+        black = Image.new("L", picture.size, 0)
+        return Image.merge("RGBA", (black, black, black, alpha))
@@ -0,0 +1,135 @@
+"""
+Import budget check for the launcher modules
+Measures module import cost with `python -X importtime` and fails when a
+module goes over its budget. Also derives the frozen build package list
+from the modules the launcher actually imports.
+
+Each budget is the module's measured cost plus BUDGET_MARGIN_MS. Costs are
+the median of five `measure_import_time` calls (each the best of three
+fresh interpreters), rounded up to 5 ms. Re-measure with
+
+    python -c "import statistics, import_budget as b; \
+    print({m: statistics.median(b.measure_import_time(m)[m] for _ in range(5)) \
+    for m in b.MEASURED_IMPORT_MS})"
+
+and update MEASURED_IMPORT_MS when a change legitimately moves a cost.
+"""
+
+import ast
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set
+
+PROJECT_DIR = Path(__file__).parent
+
+# Modules that make up the application and their measured import cost (ms)
+MEASURED_IMPORT_MS = {
+    "async_bridge": 75,
+    "catalog": 25,
+    "config": 20,
+    "utilities": 40,
+    "launch": 50,
+    "layout": 15,
+    "metrics": 25,
+    "probes": 85,
+    "search": 20,
+    "themes": 25,
+    "warmup": 40,
+    "watcher": 45,
+    "icons": 40,
+    "instance": 15,
+    "gui": 120,
+    "launcher": 125,
+}
+
+# Headroom for run-to-run noise; a regression bigger than this fails the check
+BUDGET_MARGIN_MS = 20
+
+# What importing each module may cost (ms)
+IMPORT_BUDGET_MS = {module: cost + BUDGET_MARGIN_MS
+                    for module, cost in MEASURED_IMPORT_MS.items()}
+
+# Standard library packages cx_Freeze pulls in by default that we never use
+FROZEN_EXCLUDE_CANDIDATES = [
+    "tkinter.test",
+    "unittest",
+    "pydoc",
+    "pydoc_data",
+    "lib2to3",
+    "xmlrpc",
+    "test",
+]
+
+
+def measure_import_time(module: str, runs: int = 3) -> Dict[str, float]:
+    """Import a module in fresh interpreters and return the best cumulative ms per module."""
+    timings: Dict[str, float] = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            name, ms = name.strip(), int(cumulative) / 1000
+            timings[name] = min(ms, timings.get(name, ms))
+    return timings
+
+
+def check_budget(budget: Dict[str, float] = IMPORT_BUDGET_MS) -> List[str]:
+    """Return a message for every module that is over its import budget."""
+    failures = []
+    for module, limit in budget.items():
+        cost = measure_import_time(module)[module]
+        status = "over budget" if cost > limit else "ok"
+        print(f"{module:<12} {cost:8.1f} ms  (budget {limit} ms) {status}")
+        if cost > limit:
+            failures.append(f"{module} took {cost:.1f} ms, budget is {limit} ms")
+    return failures
+
+
+def import_graph() -> Set[str]:
+    """Collect the top-level packages imported anywhere in the application modules.
+
+    Imports inside functions are included, so lazily loaded modules still
+    end up in the frozen build.
+    """
+    local = set(IMPORT_BUDGET_MS)
+    packages = set()
+    for module in local:
+        tree = ast.parse((PROJECT_DIR / f"{module}.py").read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                names = [node.module]
+            else:
+                continue
+            packages.update(name.split(".")[0] for name in names)
+    return packages - local
+
+
+def frozen_packages() -> List[str]:
+    """Packages the frozen build must bundle, skipping optional ones not installed."""
+    return sorted(name for name in import_graph()
+                  if importlib.util.find_spec(name) is not None)
+
+
+def frozen_excludes() -> List[str]:
+    """Packages the frozen build can leave out."""
+    used = import_graph()
+    return [name for name in FROZEN_EXCLUDE_CANDIDATES if name not in used]
+
+
+if __name__ == "__main__":
+    failures = check_budget()
+    if failures:
+        print("\n".join(failures), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,189 @@
+"""Single-instance support for the launcher application.
+
+The first launcher process listens on a local Unix socket. Later
+invocations hand their command to it and exit without importing the GUI
+stack, so this module only uses cheap standard library imports.
+"""
+import os
+import socket
+import sys
+import threading
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Command -> (fewest, most) arguments
+COMMANDS = {"show": (0, 0), "launch": (1, 1), "reload": (0, 0), "quit": (0, 0),
+            "export": (0, 1)}
+USAGE = ("usage: launcher.py [--daemon] "
+         "[show | launch <key> | reload | quit | export [file.csv]]")
+DEFAULT_EXPORT = "analytics_export.csv"
+CONNECT_TIMEOUT = 0.5
+
+
+def socket_path() -> Optional[str]:
+    """Where the running instance listens, or None where Unix sockets are unavailable."""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    override = os.environ.get("APP_LAUNCHER_SOCKET")
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+        runtime_dir = tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"app-launcher-{os.getuid()}.sock")
+
+
+def parse_args(argv: Sequence[str]) -> Tuple[List[str], bool]:
+    """Split arguments into a command with its arguments and the daemon flag."""
+    args = [arg for arg in argv if arg != "--daemon"]
+    daemon = len(args) != len(argv)
+    if not args:
+        return ([] if daemon else ["show"]), daemon
+    if args[0] not in COMMANDS or \
+            not COMMANDS[args[0]][0] <= len(args) - 1 <= COMMANDS[args[0]][1]:
+        raise SystemExit(USAGE)
+    if args[0] == "export":
+        # The running instance may have a different working directory
+        args = ["export", os.path.abspath(args[1] if len(args) > 1 else DEFAULT_EXPORT)]
+    return args, daemon
+
+
+def send(command: Sequence[str], path: Optional[str] = None) -> Optional[str]:
+    """Send a command to the running instance and return its reply, or None if none runs."""
+    path = path or socket_path()
+    if path is None:
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT)
+            client.connect(path)
+            client.sendall(("\t".join(command) + "\n").encode("utf-8"))
+            return client.makefile("r", encoding="utf-8").readline().strip()
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except OSError:
+        # Stale or unresponsive socket; the caller starts a fresh instance
+        return None
+
+
+def forward(argv: Sequence[str]) -> bool:
+    """Hand a command to a running instance, returning whether one took it."""
+    command, daemon = parse_args(argv)
+    reply = send(command or ["ping"])
+    if reply is None:
+        return False
+    if reply != "ok":
+        raise SystemExit(reply)
+    if daemon:
+        print("App Launcher is already running", file=sys.stderr)
+    return True
+
+
+class InstanceServer:
+    """Listens for commands from later invocations of the launcher.
+
+    The socket is claimed before the GUI is built so a second invocation
+    can never start a second window. Commands that arrive before a handler
+    is attached are held and handed to it on ``attach``.
+    """
+
+    def __init__(self, on_command: Optional[Callable[[str, List[str]], Optional[str]]] = None,
+                 path: Optional[str] = None):
+        """Initialize the server; `on_command` returns an error message or None."""
+        self.on_command = on_command
+        self.path = path or socket_path()
+        self._socket: Optional[socket.socket] = None
+        self._pending: List[Tuple[str, List[str]]] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Start listening, returning False if another instance already is."""
+        if self.path is None:
+            return True
+        if send(["ping"], self.path) is not None:
+            return False
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.path)
+        except OSError:
+            # Lost a race with another instance starting at the same time
+            server.close()
+            return False
+        os.chmod(self.path, 0o600)
+        server.listen(8)
+        self._socket = server
+        threading.Thread(target=self._serve, args=(server,), name="instance-server",
+                         daemon=True).start()
+        return True
+
+    def attach(self, on_command: Callable[[str, List[str]], Optional[str]]) -> None:
+        """Start handing commands to a handler, including any that arrived before it."""
+        with self._lock:
+            self.on_command = on_command
+            pending, self._pending = self._pending, []
+        for command, args in pending:
+            on_command(command, args)
+
+    def _serve(self, server: socket.socket) -> None:
+        """Answer connections until the socket is closed."""
+        while True:
+            try:
+                client, _ = server.accept()
+            except OSError:
+                return
+            with client:
+                try:
+                    client.settimeout(CONNECT_TIMEOUT)
+                    line = client.makefile("r", encoding="utf-8").readline().rstrip("\n")
+                    command, *args = line.split("\t")
+                    try:
+                        error = self._dispatch(command, args)
+                    except Exception as e:
+                        # A bad command must not take the server down with it
+                        error = f"{command} failed: {e}"
+                    client.sendall(f"{error or 'ok'}\n".encode("utf-8"))
+                except OSError:
+                    continue
+
+    def _dispatch(self, command: str, args: List[str]) -> Optional[str]:
+        """Check a command's arguments and run it, returning an error message or None."""
+        if command == "ping":
+            return None
+        if command not in COMMANDS:
+            return f"unknown command {command!r}"
+        fewest, most = COMMANDS[command]
+        if not fewest <= len(args) <= most:
+            return USAGE
+        with self._lock:
+            if self.on_command is None:
+                self._pending.append((command, args))
+                return None
+        return self.on_command(command, args)
+
+    def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        if self._socket is None:
+            return
+        try:
+            # Wakes the thread blocked in accept()
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        self._socket = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def main() -> None:
+    """Console entry point: hand the command to a running launcher or start one."""
+    if forward(sys.argv[1:]):
+        return
+    import launcher
+    launcher.main()
@@ -0,0 +1,227 @@
+"""Launch execution for the launcher application."""
+import os
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Sequence, Set
+from metrics import metrics
+from utilities import logger
+
+
+class AlreadyRunning(Exception):
+    """Raised when a single-instance command is already running."""
+
+
+class ProcessLauncher:
+    """Starts local commands and reaps them without blocking the caller.
+
+    Resolved executable paths and the environment are cached, so a launch
+    only pays for the spawn itself.
+    """
+
+    def __init__(self):
+        """Initialize with empty caches."""
+        self._lock = threading.Lock()
+        self._paths: Dict[str, str] = {}
+        self._env: Optional[Dict[str, str]] = None
+        self._running: Dict[str, subprocess.Popen] = {}
+
+    def resolve(self, program: str) -> str:
+        """Return the full path of a program, caching the lookup."""
+        path = self._paths.get(program)
+        if path is None:
+            path = shutil.which(program)
+            if path is None:
+                raise FileNotFoundError(f"{program} was not found")
+            self._paths[program] = path
+        return path
+
+    def environment(self) -> Dict[str, str]:
+        """Snapshot of the environment that launched commands inherit."""
+        if self._env is None:
+            self._env = dict(os.environ)
+        return self._env
+
+    def is_running(self, key: str) -> bool:
+        """Check whether a command started under a key is still running."""
+        with self._lock:
+            proc = self._running.get(key)
+            return proc is not None and proc.poll() is None
+
+    def spawn(self, key: str, command: Sequence[str],
+              single_instance: bool = False) -> subprocess.Popen:
+        """Start a command, refusing a second copy of a single-instance one."""
+        if single_instance and self.is_running(key):
+            raise AlreadyRunning(f"{key} is already running")
+        
+        args = [self.resolve(command[0]), *command[1:]]
+        options: Dict[str, Any] = {}
+        if sys.platform == "win32":
+            options["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            options["start_new_session"] = True
+        proc = subprocess.Popen(args, env=self.environment(),
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, **options)
+        with self._lock:
+            self._running[key] = proc
+        threading.Thread(target=self._reap, args=(key, proc),
+                         name=f"reap-{proc.pid}", daemon=True).start()
+        return proc
+
+    def _reap(self, key: str, proc: subprocess.Popen) -> None:
+        """Wait for a child to exit so it never lingers as a zombie."""
+        code = proc.wait()
+        with self._lock:
+            if self._running.get(key) is proc:
+                del self._running[key]
+        logger.info("%s exited with code %s", key, code)
+
+
+class LaunchExecutor:
+    """Opens launch targets on a worker pool so clicks never block the Tk loop."""
+
+    LATENCY_SAMPLES = 200
+
+    def __init__(self, root: Any, analytics: Optional[Any] = None,
+                 workers: int = 2, max_pending: int = 16,
+                 dedupe_window: float = 0.5):
+        """Initialize the executor and start its worker threads."""
+        self.root = root
+        self.analytics = analytics
+        self.processes = ProcessLauncher()
+        self.dedupe_window = dedupe_window
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._in_flight: Set[str] = set()
+        self._last_submit: Dict[str, float] = {}
+        self._browser: Optional[Any] = None
+        self._browser_resolved = False
+        self._browser_lock = threading.Lock()
+        self.is_warm: Optional[Callable[[str], bool]] = None
+        self.spawn_latency: Dict[str, Deque[float]] = {
+            "warm": deque(maxlen=self.LATENCY_SAMPLES),
+            "cold": deque(maxlen=self.LATENCY_SAMPLES),
+        }
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"launch-worker-{i}",
+                             daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _resolve_browser(self) -> Optional[Any]:
+        """Resolve the default browser controller on first use and cache it."""
+        import webbrowser
+        
+        with self._browser_lock:
+            if not self._browser_resolved:
+                try:
+                    self._browser = webbrowser.get()
+                except webbrowser.Error as e:
+                    logger.error("Failed to resolve browser: %s", e)
+                self._browser_resolved = True
+            return self._browser
+
+    def prepare(self) -> None:
+        """Create the browser controller ahead of the first launch."""
+        self._resolve_browser()
+
+    def submit(self, entry: Any, status_label: Optional[Any] = None) -> bool:
+        """Queue an entry for launching, dropping rapid repeat clicks on it."""
+        key = entry.key
+        now = time.monotonic()
+        with self._lock:
+            if key in self._in_flight or \
+                    now - self._last_submit.get(key, float("-inf")) < self.dedupe_window:
+                metrics.count("launch_deduped")
+                return False
+            try:
+                self._queue.put_nowait((entry, status_label, time.perf_counter()))
+            except queue.Full:
+                metrics.count("launch_rejected")
+                self._post(status_label, "Busy, please try again...")
+                return False
+            self._in_flight.add(key)
+            self._last_submit[key] = now
+        return True
+
+    def _worker(self) -> None:
+        """Launch queued entries until shut down."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            entry, status_label, submitted = job
+            target = entry.target
+            warm = bool(self.is_warm and self.is_warm(target))
+            try:
+                if entry.command:
+                    self._spawn(entry)
+                else:
+                    self._open_url(entry.url)
+                latency = (time.perf_counter() - submitted) * 1000
+                self.spawn_latency["warm" if warm else "cold"].append(latency)
+                metrics.record("launch", latency)
+                if self.analytics:
+                    self.analytics.track_spawn_latency(entry.label, latency)
+                self._post(status_label, f"Opening {entry.label}...")
+                logger.info("Opened %s", target)
+            except AlreadyRunning:
+                self._post(status_label, f"{entry.label} is already running")
+            except Exception as e:
+                metrics.count("launch_failures")
+                error_msg = f"Failed to open {target}: {str(e)}"
+                self._post(status_label, error_msg)
+                logger.error(error_msg)
+            finally:
+                with self._lock:
+                    self._in_flight.discard(entry.key)
+
+    def _open_url(self, url: str) -> None:
+        """Open a URL with the cached browser controller."""
+        browser = self._resolve_browser()
+        if browser is None:
+            raise RuntimeError("no runnable browser")
+        if not browser.open(url):
+            raise RuntimeError("browser refused to open the URL")
+
+    def _spawn(self, entry: Any) -> None:
+        """Start the local command of an entry."""
+        self.processes.spawn(entry.key, entry.command, entry.single_instance)
+
+    def latency_report(self) -> str:
+        """Summarize click-to-spawn latency for warm and cold launches."""
+        parts = []
+        for kind, samples in self.spawn_latency.items():
+            if samples:
+                parts.append(f"{kind} median {statistics.median(samples):.1f} ms "
+                             f"over {len(samples)} launches")
+            else:
+                parts.append(f"{kind} no launches")
+        return "Launch latency: " + ", ".join(parts)
+
+    def _post(self, status_label: Optional[Any], text: str) -> None:
+        """Update the status label from the Tk thread."""
+        if status_label:
+            self._call_soon(lambda: status_label.configure(text=text))
+
+    def _call_soon(self, callback: Callable[[], None]) -> None:
+        """Schedule a callback on the Tk event loop."""
+        try:
+            self.root.after(0, callback)
+        except RuntimeError:
+            # The main loop has already gone away during shutdown
+            pass
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued launches are done."""
+        for _ in self._workers:
+            self._queue.put(None)
@@ -4,38 +4,153 @@ Main application file that brings everything together
 Created by ApexDazza
 """
 
+import time
+_IMPORT_START = time.perf_counter()
+
+import sys
+if __name__ == "__main__":
+    # Hand the command to a running launcher before importing the GUI stack
+    from instance import forward
+    if forward(sys.argv[1:]):
+        sys.exit(0)
+
 import customtkinter as ctk
-from typing import Optional
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
 from config import Config
-from utilities import logger, Analytics
-from gui import LauncherButton, DragDropManager
-import keyboard
+from metrics import metrics
+from utilities import logger, Analytics, StartupProfiler, get_session_id, shutdown_logging
+from gui import (LauncherButton, DragDropManager, VirtualGrid, QuickLaunchPalette,
+                 MetricsOverlay)
+from icons import IconCache
+from instance import InstanceServer, forward, parse_args
+from launch import LaunchExecutor
+from catalog import Catalog, Entry
+from layout import Layout
+from search import SearchIndex
+from themes import ThemeEngine
+from watcher import FileWatcher
+from warmup import WarmupManager
 
 class AppLauncher:
     """Main application class for the launcher."""
     
-    def __init__(self):
-        """Initialize the application."""
+    FRAME_INTERVAL_MS = 16
+    PROBE_INTERVAL_MS = 60000
+    TILE_CHUNK_SIZE = 8
+    
+    def __init__(self, daemon: bool = False):
+        """Initialize the application.
+
+        In daemon mode the window starts hidden and closing it only hides
+        it again, so a later ``show`` brings it up without rebuilding it.
+        """
+        self.profiler = StartupProfiler(_IMPORT_START)
+        self.profiler.mark("imports")
         self.config = Config()
         self.analytics = Analytics()
-        self.drag_manager = DragDropManager()
-        self.is_edit_mode = False
         self.widgets = {}
+        self.widget_keys = {}
+        self.drag_manager = DragDropManager(lambda: self.widgets.values())
+        self.highlighted = None
+        self.drag_frame_job = None
+        self.virtual_grid = None
+        self.search_index = None
+        self.keys_by_label = {}
+        self.warmup = None
+        self.bridge = None
+        self.prober = None
+        self.palette = None
+        self.metrics_overlay = None
+        self.server = None
+        self.watcher = None
+        self.daemon = daemon
+        self.is_edit_mode = False
         
         # Load layout
         self.button_layout = self.config.load_layout()
+        self.themes = ThemeEngine(self.config.THEMES, self.config.SETTINGS["theme"])
+        self.profiler.mark("config")
         
+        # Paint the window shell first, tiles and the rest follow when idle
         self.setup_gui()
+        self.profiler.mark("window")
+        if len(self.button_layout) > self.config.SETTINGS["virtual_grid_threshold"]:
+            self.root.after_idle(self.build_virtual_grid)
+        else:
+            self.configure_grid()
+            self.pending_tiles = [entry for entry in self.button_layout
+                                  if entry[0] is not None]
+            self.root.after_idle(self.build_next_tiles)
+
+    def build_next_tiles(self) -> None:
+        """Build the next chunk of tiles, yielding to the event loop between chunks."""
+        if not self.widgets:
+            self.profiler.mark("first paint")
+        chunk = self.pending_tiles[:self.TILE_CHUNK_SIZE]
+        del self.pending_tiles[:self.TILE_CHUNK_SIZE]
+        for key, row, col in chunk:
+            self.create_button(key, row, col)
+        
+        if self.pending_tiles:
+            self.root.after_idle(self.build_next_tiles)
+        else:
+            self.profiler.mark("tiles")
+            self.root.after_idle(self.finish_startup)
+
+    def build_virtual_grid(self) -> None:
+        """Build a scrolling grid that only creates the tiles in view."""
+        self.profiler.mark("first paint")
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        self.virtual_grid = VirtualGrid(
+            self.main_frame,
+            self.button_layout,
+            self.config.catalog.get,
+            self.create_pooled_button,
+            fg_color=self.themes.color("bg_color")
+        )
+        self.virtual_grid.grid(row=0, column=0, sticky="nsew")
+        self.profiler.mark("tiles")
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self) -> None:
+        """Run the startup work that is not needed for the first paint."""
+        # asyncio is slow to import, so the bridge only starts once tiles are up
+        from async_bridge import AsyncBridge
+        
+        self.bridge = AsyncBridge(self.root)
+        self.bridge.start()
+        metrics.watch_loop(self.root)
         self.setup_keyboard_shortcuts()
+        self.build_search_index()
+        self.analytics.on_click(self.on_click)
+        if self.config.SETTINGS["enable_status_probes"]:
+            from probes import StatusProber
+            
+            self.prober = StatusProber(self.bridge)
+            self.refresh_status()
+        if self.config.SETTINGS["enable_warmup"]:
+            self.warmup = WarmupManager(self.analytics, self.config.catalog,
+                                        self.launcher)
+            self.warmup.start()
+        
+        if self.config.SETTINGS["watch_files"]:
+            self.watcher = FileWatcher([self.config.layout_file, self.config.catalog_file],
+                                       self.on_file_change)
+            self.watcher.start()
         
         # Track launch
         if self.config.SETTINGS["enable_analytics"]:
             self.analytics.track_launch()
+        self.profiler.mark("deferred")
+        logger.info(self.profiler.report())
 
     def setup_gui(self) -> None:
         """Setup the main GUI elements."""
         # Set theme
-        ctk.set_appearance_mode("dark")
+        ctk.set_appearance_mode(self.themes.name)
         
         # Create main window
         self.root = ctk.CTk()
@@ -43,23 +158,27 @@ class AppLauncher:
         self.root.geometry("600x650")
         self.root.minsize(500, 500)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if self.daemon:
+            self.root.withdraw()
+        self.launcher = LaunchExecutor(self.root, self.analytics)
+        self.icons = IconCache(scale=ctk.ScalingTracker.get_window_scaling(self.root))
         
         # Configure grid
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
         # Create main frame
-        self.main_frame = ctk.CTkFrame(self.root, fg_color="black")
+        self.main_frame = ctk.CTkFrame(self.root, fg_color=self.themes.color("bg_color"))
         self.main_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
-        # Configure main frame grid
-        for i in range(4):
+        self.setup_status_bar()
+
+    def configure_grid(self) -> None:
+        """Size the main frame grid to the rows and columns of the layout."""
+        for i in range(self.button_layout.rows):
             self.main_frame.grid_rowconfigure(i, weight=1)
-        for i in range(3):
+        for i in range(self.button_layout.columns):
             self.main_frame.grid_columnconfigure(i, weight=1)
-            
-        self.setup_status_bar()
-        self.create_buttons()
 
     def setup_status_bar(self) -> None:
         """Setup the status and edit bar."""
@@ -73,92 +192,269 @@ class AppLauncher:
             self.bottom_bar,
             text="Ready",
             font=("Segoe UI", 12),
-            text_color="gray"
+            text_color=self.themes.color("muted_text_color")
         )
         self.status_label.grid(row=0, column=0, sticky="w")
         
+        # Create metrics toggle
+        self.metrics_button = ctk.CTkButton(
+            self.bottom_bar,
+            text="📊",
+            width=40,
+            command=self.toggle_metrics
+        )
+        self.metrics_button.grid(row=0, column=1, sticky="e", padx=(0, 5))
+        
         # Create edit button
         self.edit_button = ctk.CTkButton(
             self.bottom_bar,
             text="✏️ Edit",
             width=100,
+            fg_color=self.themes.color("button_color"),
             command=self.toggle_edit_mode
         )
-        self.edit_button.grid(row=0, column=1, sticky="e")
+        self.edit_button.grid(row=0, column=2, sticky="e")
 
     def create_buttons(self) -> None:
         """Create and place buttons according to layout."""
         for key, row, col in self.button_layout:
             if key is None:
                 continue
-                
-            button = LauncherButton(
-                self.main_frame,
-                self.config.BUTTON_LOGOS[key],
-                self.config.LABEL_TEXT[key],
-                self.config.URLS[key],
-                self.status_label,
-                self.config.THEMES["dark"],
-                self.analytics
-            )
-            
-            button.grid(row=row, column=col, sticky="nsew", padx=10, pady=10)
-            button.set_drag_bindings(
-                self.drag_manager.start_drag,
-                self.on_drag_motion,
-                self.on_drop
+            self.create_button(key, row, col)
+
+    def resolve_entry(self, key: str) -> Optional[Entry]:
+        """Look up the catalog entry of a layout key."""
+        entry = self.config.catalog.get(key)
+        if entry is None:
+            logger.warning("No catalog entry for layout key %r", key)
+        return entry
+
+    def create_pooled_button(self, parent: ctk.CTkFrame) -> LauncherButton:
+        """Create an unbound button for the virtual grid to recycle."""
+        button = LauncherButton(
+            parent, None,
+            self.status_label,
+            self.themes.theme,
+            self.analytics,
+            self.launcher,
+            self.icons
+        )
+        return button
+
+    def create_button(self, key: str, row: int, col: int) -> Optional[LauncherButton]:
+        """Create a single button and place it in the grid."""
+        entry = self.resolve_entry(key)
+        if entry is None:
+            return None
+        
+        button = LauncherButton(
+            self.main_frame,
+            entry,
+            self.status_label,
+            self.themes.theme,
+            self.analytics,
+            self.launcher,
+            self.icons
+        )
+        
+        button.grid(row=row, column=col, sticky="nsew", padx=10, pady=10)
+        button.set_drag_bindings(
+            self.drag_manager.start_drag,
+            self.on_drag_motion,
+            self.on_drop
+        )
+        self.widgets[key] = button
+        self.widget_keys[button] = key
+        return button
+
+    def reconcile_layout(self, layout: Layout) -> int:
+        """Bring the widgets in line with a layout, returning the operation count."""
+        if self.virtual_grid is not None:
+            self.button_layout = layout
+            return self.virtual_grid.set_layout(layout)
+        
+        operations = 0
+        
+        for key in [k for k in self.widgets if k not in layout]:
+            button = self.widgets.pop(key)
+            del self.widget_keys[button]
+            button.destroy()
+            operations += 1
+        
+        for key, row, col in layout:
+            if key is None:
+                continue
+            if key not in self.widgets:
+                if self.create_button(key, row, col) is not None:
+                    operations += 1
+            elif self.button_layout.cell_of(key) != (row, col):
+                self.widgets[key].grid(row=row, column=col)
+                operations += 1
+        
+        self.button_layout = layout
+        self.configure_grid()
+        return operations
+
+    def refresh_status(self) -> None:
+        """Probe every entry in the background, then schedule the next round."""
+        self.prober.refresh(self.config.catalog, self.apply_status)
+        self.root.after(self.PROBE_INTERVAL_MS, self.refresh_status)
+
+    def apply_status(self, statuses: Dict[str, str]) -> None:
+        """Update all tile badges from one batch of probe results."""
+        if self.virtual_grid is not None:
+            self.virtual_grid.set_statuses(statuses)
+            return
+        for key, status in statuses.items():
+            button = self.widgets.get(key)
+            if button is not None:
+                button.set_status(status)
+
+    def build_search_index(self) -> None:
+        """Index every configured entry for the quick-launch palette."""
+        self.search_index = SearchIndex(self.click_count, lambda: self.analytics.revision)
+        for entry in self.config.catalog:
+            self.search_index.add(entry.key, entry.label, entry.target)
+        self.index_labels()
+
+    def index_labels(self) -> None:
+        """Map labels, which analytics counts clicks by, to entry keys."""
+        self.keys_by_label = {}
+        for entry in self.config.catalog:
+            self.keys_by_label.setdefault(entry.label, []).append(entry.key)
+
+    def on_click(self, label: str) -> None:
+        """Re-rank the clicked entries in the search index."""
+        if self.search_index is not None:
+            self.search_index.touch(*self.keys_by_label.get(label, ()))
+
+    def click_count(self, key: str) -> int:
+        """Number of recorded clicks on an entry."""
+        entry = self.config.catalog.get(key)
+        return self.analytics.data["button_clicks"].get(entry.label, 0) if entry else 0
+
+    def show_palette(self) -> None:
+        """Open the quick-launch palette."""
+        if self.search_index is None:
+            return
+        if self.palette is None:
+            self.palette = QuickLaunchPalette(
+                self.root,
+                self.search_index,
+                lambda key: f"{self.config.catalog.get(key).logo}  "
+                            f"{self.config.catalog.get(key).label}",
+                self.launch_entry,
+                self.themes.theme
             )
-            self.widgets[key] = button
+        self.palette.show()
+
+    def launch_entry(self, key: str) -> None:
+        """Launch an entry without going through its tile."""
+        entry = self.config.catalog.get(key)
+        self.launcher.submit(entry, self.status_label)
+        self.analytics.track_button_click(entry.label)
+
+    def toggle_metrics(self) -> None:
+        """Show or hide the performance overlay."""
+        if self.metrics_overlay is None:
+            self.metrics_overlay = MetricsOverlay(self.root, metrics,
+                                                  self.export_metrics)
+        self.metrics_overlay.toggle()
+
+    def export_metrics(self) -> None:
+        """Write the collected metrics to a JSON file."""
+        path = Path(f"metrics_{get_session_id()}.json")
+        try:
+            metrics.export(path)
+            self.status_label.configure(text=f"Metrics exported to {path}")
+            logger.info("Metrics exported to %s", path)
+        except Exception as e:
+            error_msg = f"Failed to export metrics: {str(e)}"
+            self.status_label.configure(text=error_msg)
+            logger.error(error_msg)
+
+    def switch_theme(self, name: Optional[str] = None) -> None:
+        """Switch to a theme, or to the next one when no name is given."""
+        if name is None:
+            modes = self.themes.MODES
+            name = modes[(modes.index(self.themes.name) + 1) % len(modes)]
+        self.themes.apply(name)
+        self.config.update_settings({"theme": name})
+        self.status_label.configure(text=f"Theme: {name}")
+        logger.info("Switched to the %s theme in %.1f ms", name, self.themes.last_switch_ms)
 
     def toggle_edit_mode(self) -> None:
         """Toggle between edit and normal mode."""
         self.is_edit_mode = not self.is_edit_mode
-        mode_color = "green" if self.is_edit_mode else self.config.THEMES["dark"]["button_color"]
         mode_text = "✔️ Done" if self.is_edit_mode else "✏️ Edit"
         status_text = "Edit Mode: Drag to rearrange buttons." if self.is_edit_mode else "Ready"
+        if self.is_edit_mode and self.virtual_grid is not None:
+            status_text = "Edit Mode: Rearranging is not available for large catalogs."
         
-        self.edit_button.configure(text=mode_text, fg_color=mode_color)
+        self.edit_button.configure(
+            text=mode_text,
+            fg_color=self.themes.color("active_color" if self.is_edit_mode else "button_color")
+        )
         self.status_label.configure(text=status_text)
 
     def on_drag_motion(self, event) -> None:
         """Handle drag motion."""
         if not self.drag_manager.drag_data["ghost"]:
             return
-            
-        # Update ghost position
-        dx = event.x_root - self.drag_manager.drag_data["start_pos"][0]
-        dy = event.y_root - self.drag_manager.drag_data["start_pos"][1]
+        
+        metrics.count("drag_motion")
+        # Keep only the latest pointer position and render it on the next frame
+        self.drag_manager.drag_data["pointer"] = (event.x_root, event.y_root)
+        if self.drag_frame_job is None:
+            self.drag_frame_job = self.root.after(self.FRAME_INTERVAL_MS,
+                                                  self.render_drag_frame)
+
+    def render_drag_frame(self) -> None:
+        """Apply the latest coalesced drag position."""
+        self.drag_frame_job = None
         ghost = self.drag_manager.drag_data["ghost"]
-        ghost.geometry(f"+{event.x_root-30}+{event.y_root-30}")
+        pointer = self.drag_manager.drag_data["pointer"]
+        if not ghost or pointer is None:
+            return
         
-        # Highlight potential drop target
-        self.highlight_drop_target(event)
+        x, y = pointer
+        with metrics.timer("drag_frame"):
+            ghost.geometry(f"+{x-30}+{y-30}")
+            
+            # Highlight potential drop target
+            self.highlight_drop_target(x, y)
+
+    def cancel_drag_frame(self) -> None:
+        """Drop any drag frame that has not been rendered yet."""
+        if self.drag_frame_job is not None:
+            self.root.after_cancel(self.drag_frame_job)
+            self.drag_frame_job = None
+        self.drag_manager.drag_data["pointer"] = None
 
-    def highlight_drop_target(self, event) -> None:
+    def highlight_drop_target(self, x: int, y: int) -> None:
         """Highlight the potential drop target."""
-        for widget in self.widgets.values():
-            widget.configure(border_width=0)
+        target = self.drag_manager.find_target(x, y)
+        if target is self.highlighted:
+            return
         
-        target = self.find_target_widget(event)
+        self.clear_highlight()
         if target:
             target.configure(
                 border_width=2,
-                border_color=self.config.THEMES["dark"]["highlight_color"]
+                border_color=self.themes.color("highlight_color")
             )
+            self.highlighted = target
+
+    def clear_highlight(self) -> None:
+        """Remove the highlight from the current drop target."""
+        if self.highlighted is not None:
+            if self.highlighted.winfo_exists():
+                self.highlighted.configure(border_width=0)
+            self.highlighted = None
 
     def find_target_widget(self, event) -> Optional[LauncherButton]:
         """Find the widget under the cursor."""
-        x, y = event.x_root, event.y_root
-        for widget in self.widgets.values():
-            if widget == self.drag_manager.drag_data["widget"]:
-                continue
-            wx = widget.winfo_rootx()
-            wy = widget.winfo_rooty()
-            ww = widget.winfo_width()
-            wh = widget.winfo_height()
-            if wx < x < wx + ww and wy < y < wy + wh:
-                return widget
-        return None
+        return self.drag_manager.find_target(event.x_root, event.y_root)
 
     def on_drop(self, event) -> None:
         """Handle drop event."""
@@ -168,65 +464,189 @@ class AppLauncher:
         dragged = self.drag_manager.drag_data["widget"]
         start_info = self.drag_manager.drag_data["start_info"]
         
-        if self.drag_manager.drag_data["ghost"]:
-            self.drag_manager.drag_data["ghost"].destroy()
-            self.drag_manager.drag_data["ghost"] = None
+        self.cancel_drag_frame()
+        self.drag_manager.release_ghost()
         
         target = self.find_target_widget(event)
-        for widget in self.widgets.values():
-            widget.configure(border_width=0)
+        self.clear_highlight()
         
         if target:
+            dragged_key = self.widget_keys[dragged]
+            target_key = self.widget_keys[target]
+            
             # Swap positions
-            target_info = target.grid_info()
-            dragged.grid(row=target_info['row'], column=target_info['column'],
+            target_row, target_col = self.button_layout.cell_of(target_key)
+            dragged.grid(row=target_row, column=target_col,
                         sticky="nsew", padx=10, pady=10)
             target.grid(row=start_info['row'], column=start_info['column'],
                        sticky="nsew", padx=10, pady=10)
             
             # Update layout
-            dragged_key = next(k for k, v in self.widgets.items() if v == dragged)
-            target_key = next(k for k, v in self.widgets.items() if v == target)
-            
-            self.update_layout(dragged_key, target_key,
-                             target_info['row'], target_info['column'],
-                             start_info['row'], start_info['column'])
+            self.update_layout(dragged_key, target_key)
         else:
             # Return to original position
             dragged.grid(row=start_info['row'], column=start_info['column'],
                         sticky="nsew", padx=10, pady=10)
         
         self.drag_manager.drag_data["widget"] = None
+        self.drag_manager.index = None
 
-    def update_layout(self, dragged_key: str, target_key: str,
-                     target_row: int, target_col: int,
-                     start_row: int, start_col: int) -> None:
+    def update_layout(self, dragged_key: str, target_key: str) -> None:
         """Update and save the button layout."""
-        for i, (key, r, c) in enumerate(self.button_layout):
-            if key == dragged_key:
-                self.button_layout[i] = (dragged_key, target_row, target_col)
-            elif key == target_key:
-                self.button_layout[i] = (target_key, start_row, start_col)
-        
+        self.button_layout.swap(dragged_key, target_key)
         self.config.save_layout(self.button_layout)
 
     def setup_keyboard_shortcuts(self) -> None:
         """Set up keyboard shortcuts."""
+        import keyboard
+        
         keyboard.add_hotkey('ctrl+e', self.toggle_edit_mode)
-        keyboard.add_hotkey('ctrl+s', 
-                          lambda: self.config.save_layout(self.button_layout))
+        keyboard.add_hotkey('ctrl+s', self.save_layout_now)
         keyboard.add_hotkey('ctrl+r', self.refresh_layout)
+        
+        # Window shortcuts only fire while the launcher has focus
+        self.root.bind("<Control-k>", lambda event: self.show_palette())
+        self.root.bind("<Control-m>", lambda event: self.toggle_metrics())
+        self.root.bind("<Control-t>", lambda event: self.switch_theme())
+
+    def save_layout_now(self) -> None:
+        """Write the layout to file in the background."""
+        self.bridge.submit(
+            self.bridge.run_blocking(self.config.save_layout, self.button_layout, True)
+        )
 
     def refresh_layout(self) -> None:
-        """Refresh the button layout."""
-        self.button_layout = self.config.load_layout()
-        self.create_buttons()
+        """Reload the layout file in the background and apply it."""
+        self.bridge.submit(self.bridge.run_blocking(self.config.read_layout),
+                           self.apply_layout, self.on_reload_error)
+
+    def apply_layout(self, layout: Layout) -> None:
+        """Apply a reloaded layout to the widgets."""
+        operations = self.reconcile_layout(layout)
+        self.status_label.configure(text=f"Layout refreshed ({operations} changes)")
+        logger.info("Layout refreshed with %d widget operations", operations)
+
+    def serve_commands(self, server: InstanceServer) -> None:
+        """Accept commands from later invocations of the launcher."""
+        self.server = server
+        server.attach(self.on_remote_command)
+
+    def on_remote_command(self, command: str, args: List[str]) -> Optional[str]:
+        """Check a command from another invocation and queue it for the Tk thread."""
+        if command == "launch" and args[0] not in self.config.catalog:
+            return f"No entry named {args[0]!r}"
+        if command == "export":
+            # Answered here so the file exists when the caller returns
+            try:
+                rows = self.analytics.export(Path(args[0]))
+            except OSError as e:
+                return f"Failed to export analytics: {e}"
+            logger.info("Exported %d analytics rows to %s", rows, args[0])
+            return None
+        self.root.after(0, self.run_command, command, args)
+        return None
+
+    def run_command(self, command: str, args: List[str]) -> None:
+        """Carry out a show, launch, reload or quit command on the Tk thread."""
+        if command == "show":
+            self.show_window()
+        elif command == "launch":
+            if args[0] in self.config.catalog:
+                self.launch_entry(args[0])
+            else:
+                self.status_label.configure(text=f"No entry named {args[0]!r}")
+        elif command == "reload":
+            self.reload_config()
+        elif command == "quit":
+            self.shutdown()
+
+    def show_window(self) -> None:
+        """Bring the window to the front, showing it if hidden."""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+
+    def reload_config(self) -> None:
+        """Re-read the catalog and layout files and apply them if both are valid."""
+        try:
+            catalog = self.config.read_catalog()
+            layout = self.config.read_layout()
+        except (OSError, ValueError, TypeError) as e:
+            self.on_reload_error(e)
+            return
+        self.apply_catalog(catalog)
+        self.apply_layout(layout)
+
+    def on_reload_error(self, error: BaseException) -> None:
+        """Report a file that failed to reload, leaving the tiles as they are."""
+        self.status_label.configure(text=f"Reload failed: {error}")
+        logger.warning("Keeping the current tiles, reload failed: %s", error)
+
+    def on_file_change(self, path: Path, data: bytes) -> None:
+        """Parse a changed layout or catalog file off the Tk thread, then apply it there."""
+        if path == self.config.layout_file.resolve():
+            layout = self.config.parse_layout(data.decode("utf-8"))
+            if layout is not None:
+                self.root.after(0, self.apply_layout, layout)
+        elif path == self.config.catalog_file.resolve():
+            catalog = Catalog(Catalog.validate(json.loads(data)))
+            self.root.after(0, self.apply_catalog, catalog)
+
+    def apply_catalog(self, catalog: Catalog) -> None:
+        """Switch to a reloaded catalog, updating only the tiles and index entries that changed."""
+        previous = self.config.catalog
+        self.config.catalog = catalog
+        if self.virtual_grid is not None:
+            self.virtual_grid.set_resolver(catalog.get)
+        else:
+            for key in [k for k in self.widgets if k not in catalog]:
+                button = self.widgets.pop(key)
+                del self.widget_keys[button]
+                button.destroy()
+            for key, button in self.widgets.items():
+                entry = catalog.get(key)
+                if entry != button.entry:
+                    button.bind_entry(entry)
+            # Creates tiles for layout keys that only now have an entry
+            self.reconcile_layout(self.button_layout)
+        if self.warmup is not None:
+            self.warmup.catalog = catalog
+        if self.search_index is not None:
+            for entry in previous:
+                if entry.key not in catalog:
+                    self.search_index.remove(entry.key)
+            for entry in catalog:
+                if entry != previous.get(entry.key):
+                    self.search_index.add(entry.key, entry.label, entry.target)
+            self.index_labels()
+        logger.info("Catalog reloaded with %d entries", len(catalog))
 
     def on_close(self) -> None:
         """Handle window close event."""
+        if self.daemon:
+            self.root.withdraw()
+            return
         if self.config.SETTINGS["confirm_on_exit"]:
             if not ctk.messagebox.askokcancel("Quit", "Do you want to quit?"):
                 return
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop background work, persist state and close the window."""
+        if self.server:
+            self.server.close()
+        if self.watcher:
+            self.watcher.stop()
+        if self.warmup:
+            self.warmup.stop()
+        metrics.stop_loop_watch(self.root)
+        logger.info(self.launcher.latency_report())
+        self.launcher.shutdown()
+        if self.bridge:
+            self.bridge.stop()
+        self.config.flush_layout()
+        self.analytics.close()
+        shutdown_logging()
         self.root.destroy()
 
     def run(self) -> None:
@@ -234,13 +654,37 @@ class AppLauncher:
         try:
             self.root.mainloop()
         except Exception as e:
-            logger.error(f"Application error: {str(e)}")
+            logger.error("Application error: %s", e)
             raise
 
-if __name__ == "__main__":
+def main() -> None:
+    """Start the launcher and carry out the command it was given."""
+    command, daemon = parse_args(sys.argv[1:])
+    if command[:1] == ["quit"]:
+        print("App Launcher is not running", file=sys.stderr)
+        return
+    if command[:1] == ["export"]:
+        analytics = Analytics()
+        rows = analytics.export(Path(command[1]))
+        analytics.close()
+        print(f"Exported {rows} rows to {command[1]}")
+        return
+    # Claim the socket first so a second invocation never builds a second window
+    server = InstanceServer()
+    if not server.start():
+        if forward(sys.argv[1:]):
+            return
+        raise SystemExit("App Launcher is already running")
     try:
-        app = AppLauncher()
+        app = AppLauncher(daemon=daemon)
+        app.serve_commands(server)
+        if command[:1] == ["launch"]:
+            app.root.after_idle(app.run_command, *command[:1], command[1:])
         app.run()
     except Exception as e:
-        logger.critical(f"Failed to start application: {str(e)}")
-        raise
\ No newline at end of file
+        logger.critical("Failed to start application: %s", e)
+        server.close()
+        raise
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""Button layout model for the launcher application."""
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+
+class Layout:
+    """Grid of launcher keys with two-way key and cell indexes.
+
+    Empty cells are kept so the layout round-trips through ``layout.json``
+    unchanged.
+    """
+
+    __slots__ = ("_cells", "_keys")
+
+    def __init__(self):
+        """Initialize an empty layout."""
+        self._cells: Dict[Cell, Optional[str]] = {}
+        self._keys: Dict[str, Cell] = {}
+
+    @classmethod
+    def from_list(cls, entries: Sequence[Sequence]) -> "Layout":
+        """Build a layout from ``[key, row, col]`` entries.
+
+        Raises ValueError if a key or a cell appears twice.
+        """
+        layout = cls()
+        for key, row, col in entries:
+            cell = (int(row), int(col))
+            if cell in layout._cells:
+                raise ValueError(f"cell {cell} appears twice in the layout")
+            if key is not None and key in layout._keys:
+                raise ValueError(f"key {key!r} appears twice in the layout")
+            layout._cells[cell] = key
+            if key is not None:
+                layout._keys[key] = cell
+        return layout
+
+    def to_list(self) -> List[Tuple[Optional[str], int, int]]:
+        """Serialize to the ``layout.json`` entry format."""
+        return [(key, row, col) for (row, col), key in self._cells.items()]
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], int, int]]:
+        """Iterate over ``(key, row, col)``, including empty cells."""
+        for (row, col), key in self._cells.items():
+            yield key, row, col
+
+    def __len__(self) -> int:
+        """Number of placed keys."""
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is placed in the layout."""
+        return key in self._keys
+
+    @property
+    def rows(self) -> int:
+        """Number of grid rows spanned by the layout."""
+        return max((row for row, _ in self._cells), default=-1) + 1
+
+    @property
+    def columns(self) -> int:
+        """Number of grid columns spanned by the layout."""
+        return max((col for _, col in self._cells), default=-1) + 1
+
+    def keys(self) -> List[str]:
+        """Placed keys in layout order."""
+        return list(self._keys)
+
+    def cell_of(self, key: str) -> Optional[Cell]:
+        """Return the cell of a key, or None if it is not placed."""
+        return self._keys.get(key)
+
+    def key_at(self, row: int, col: int) -> Optional[str]:
+        """Return the key placed in a cell, or None if the cell is empty."""
+        return self._cells.get((row, col))
+
+    def swap(self, first: str, second: str) -> None:
+        """Exchange the cells of two placed keys."""
+        first_cell, second_cell = self._keys[first], self._keys[second]
+        self._keys[first], self._keys[second] = second_cell, first_cell
+        self._cells[first_cell], self._cells[second_cell] = second, first
+
+    def move(self, key: str, row: int, col: int) -> None:
+        """Move a key to a cell, swapping with any key already there."""
+        occupant = self._cells.get((row, col))
+        if occupant is not None:
+            self.swap(key, occupant)
+            return
+        self._cells[self._keys[key]] = None
+        self._cells[(row, col)] = key
+        self._keys[key] = (row, col)
+
+    def insert(self, key: str, row: int, col: int) -> None:
+        """Place a new key in an empty cell."""
+        if key in self._keys:
+            raise ValueError(f"{key!r} is already in the layout")
+        if self._cells.get((row, col)) is not None:
+            raise ValueError(f"Cell ({row}, {col}) is already occupied")
+        self._cells[(row, col)] = key
+        self._keys[key] = (row, col)
+
+    def remove(self, key: str) -> Cell:
+        """Remove a key, leaving its cell empty, and return that cell."""
+        cell = self._keys.pop(key)
+        self._cells[cell] = None
+        return cell
@@ -0,0 +1,116 @@
+"""Hot-path timers and counters for the launcher application."""
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional
+
+
+class Metrics:
+    """Named timers and counters kept in fixed-size ring buffers.
+
+    Recording appends to a bounded deque or bumps a counter, so it is
+    cheap enough for the click, drag and persistence paths and safe to
+    call from worker threads.
+    """
+
+    SAMPLES = 512
+
+    def __init__(self, samples: int = SAMPLES):
+        """Initialize empty timers and counters."""
+        self.samples = samples
+        self.started = time.time()
+        self._timers: Dict[str, Deque[float]] = {}
+        self._totals: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._loop_job: Optional[Any] = None
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Bump a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record(self, name: str, ms: float) -> None:
+        """Store a duration in milliseconds, dropping the oldest sample when full."""
+        with self._lock:
+            samples = self._timers.get(name)
+            if samples is None:
+                samples = self._timers[name] = deque(maxlen=self.samples)
+            samples.append(ms)
+            self._totals[name] = self._totals.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Time the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def watch_loop(self, root: Any, interval_ms: int = 100) -> None:
+        """Record how late Tk runs ``after`` ticks as ``loop_lag``."""
+        def tick(due: float) -> None:
+            now = time.perf_counter()
+            self.record("loop_lag", max(0.0, (now - due) * 1000))
+            self._loop_job = root.after(interval_ms, tick, now + interval_ms / 1000)
+
+        self.stop_loop_watch(root)
+        self._loop_job = root.after(interval_ms, tick,
+                                    time.perf_counter() + interval_ms / 1000)
+
+    def stop_loop_watch(self, root: Any) -> None:
+        """Stop recording event-loop lag."""
+        if self._loop_job is not None:
+            root.after_cancel(self._loop_job)
+            self._loop_job = None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, p50, p95 and max of each timer over its buffered samples."""
+        with self._lock:
+            timers = {name: (sorted(samples), self._totals[name])
+                      for name, samples in self._timers.items()}
+        result = {}
+        for name, (ordered, total) in timers.items():
+            result[name] = {
+                "count": total,
+                "mean": sum(ordered) / len(ordered),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+            }
+        return result
+
+    def counters(self) -> Dict[str, int]:
+        """Current counter values."""
+        with self._lock:
+            return dict(self._counters)
+
+    def report(self) -> str:
+        """Format timers and counters as aligned text lines."""
+        lines = [f"{name:<16} p50 {stats['p50']:7.2f}  p95 {stats['p95']:7.2f}  "
+                 f"max {stats['max']:7.2f} ms  n={stats['count']}"
+                 for name, stats in sorted(self.summary().items())]
+        lines += [f"{name:<16} {value}" for name, value in sorted(self.counters().items())]
+        return "\n".join(lines) or "No samples yet"
+
+    def export(self, path: Path) -> None:
+        """Write summaries, counters and raw samples to a JSON file."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._timers.items()}
+        data = {
+            "started": self.started,
+            "exported": time.time(),
+            "summary": self.summary(),
+            "counters": self.counters(),
+            "samples": samples,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+# Shared by every module, like the logger
+metrics = Metrics()
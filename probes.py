@@ -0,0 +1,102 @@
+"""Reachability probes for launcher entries."""
+import asyncio
+import shutil
+from typing import Any, Callable, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+from utilities import logger, TTLCache
+
+UP = "up"
+DOWN = "down"
+
+
+class StatusProber:
+    """Checks entry targets concurrently and caches the results.
+
+    URLs get an HTTP HEAD request and commands a lookup on PATH. Checks
+    run on the asyncio bridge with a cap on concurrency, a minimum spacing
+    between starts and a per-check timeout.
+    """
+
+    def __init__(self, bridge: Any, concurrency: int = 8, rate: float = 20.0,
+                 timeout: float = 3.0, ttl: float = 120.0):
+        """Initialize the prober."""
+        self.bridge = bridge
+        self.concurrency = concurrency
+        self.rate = rate
+        self.timeout = timeout
+        self.cache = TTLCache(max_size=4096, ttl=ttl)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_start = 0.0
+
+    async def probe_url(self, url: str) -> str:
+        """Send a HEAD request and report whether the server answered."""
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        ssl_context = None
+        if secure:
+            import ssl
+            ssl_context = ssl.create_default_context()
+        reader, writer = await asyncio.open_connection(
+            parts.hostname, parts.port or (443 if secure else 80),
+            ssl=ssl_context, server_hostname=parts.hostname if secure else None
+        )
+        try:
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            writer.write(f"HEAD {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                         f"User-Agent: app-launcher\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            status_line = (await reader.readline()).split()
+        finally:
+            writer.close()
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            return DOWN
+        return UP if int(status_line[1]) < 500 else DOWN
+
+    async def probe_command(self, program: str) -> str:
+        """Check that a program can be found."""
+        path = await self.bridge.run_blocking(shutil.which, program)
+        return UP if path else DOWN
+
+    async def _throttle(self) -> None:
+        """Space probe starts at least 1/rate seconds apart."""
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            if self._next_start > now:
+                await asyncio.sleep(self._next_start - now)
+            self._next_start = max(now, self._next_start) + 1 / self.rate
+
+    async def probe(self, entry: Any) -> str:
+        """Probe one entry, answering from the cache when possible."""
+        status = self.cache.get(entry.target)
+        if status is not None:
+            return status
+        async with self._slots:
+            await self._throttle()
+            try:
+                if entry.command:
+                    check = self.probe_command(entry.command[0])
+                else:
+                    check = self.probe_url(entry.url)
+                status = await asyncio.wait_for(check, self.timeout)
+            except (OSError, asyncio.TimeoutError, ValueError) as e:
+                logger.debug("Probe of %s failed: %s", entry.target, e)
+                status = DOWN
+        self.cache.put(entry.target, status)
+        return status
+
+    async def probe_all(self, entries: Iterable[Any]) -> Dict[str, str]:
+        """Probe entries concurrently, returning their status by key."""
+        if self._slots is None:
+            # Created here so they belong to the bridge's loop
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._rate_lock = asyncio.Lock()
+        entries = list(entries)
+        statuses = await asyncio.gather(*(self.probe(entry) for entry in entries))
+        return {entry.key: status for entry, status in zip(entries, statuses)}
+
+    def refresh(self, entries: Iterable[Any],
+                on_results: Callable[[Dict[str, str]], None]) -> None:
+        """Probe entries in the background and deliver all results in one Tk callback."""
+        self.bridge.submit(self.probe_all(entries), on_results)
@@ -0,0 +1,204 @@
+"""Quick-launch search index for the launcher application."""
+import bisect
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+PREFIX_LENGTH = 2
+
+
+def normalize(text: str) -> str:
+    """Lower-case and trim text for matching."""
+    return text.lower().strip()
+
+
+def target_name(target: str) -> str:
+    """Reduce a URL to its site name, or a path to its file name.
+
+    Schemes, "www.", top-level domains and URL paths would otherwise match
+    almost every entry.
+    """
+    target = normalize(target)
+    if "://" in target:
+        host = target.split("://", 1)[1].split("/", 1)[0].split(":", 1)[0]
+        if host.startswith("www."):
+            host = host[len("www."):]
+        return host.rsplit(".", 1)[0]
+    name = target.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+    return name.rsplit(".", 1)[0] if "." in name else name
+
+
+def trigrams(text: str) -> Set[str]:
+    """Split text into its overlapping three-character grams."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Trigram and prefix index over launcher entries, ranked by usage."""
+
+    # Short-query matches up to this many are ranked directly, larger sets
+    # are read off the cached popularity ranking
+    DIRECT_RANK_LIMIT = 256
+
+    def __init__(self, popularity: Optional[Callable[[str], int]] = None,
+                 generation: Optional[Callable[[], int]] = None):
+        """Initialize an empty index.
+
+        `popularity` maps an entry key to its click count and is used to
+        rank entries that match equally well. `generation` returns a number
+        that changes whenever popularity may have; the ranking of all
+        entries that empty and short queries read is cached until it does,
+        and ``touch`` keeps it current after a single entry's clicks.
+        """
+        self.popularity = popularity or (lambda key: 0)
+        self.generation = generation or (lambda: 0)
+        self._ranking: Optional[List[str]] = None
+        self._ranking_scores: List[int] = []
+        self._ranking_generation: Optional[int] = None
+        self._docs: Dict[str, Tuple[str, str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._prefixes: Dict[str, Set[str]] = {}
+        self._label_prefixes: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed entries."""
+        return len(self._docs)
+
+    def _terms(self, label: str, url: str) -> Tuple[Set[str], Set[str], Set[str]]:
+        """Trigrams, short word prefixes and short label prefixes of an entry."""
+        grams = trigrams(label) | trigrams(url)
+        prefixes = set()
+        for word in label.split() + [url]:
+            for length in range(1, PREFIX_LENGTH + 1):
+                prefixes.add(word[:length])
+        label_prefixes = {label[:length] for length in range(1, PREFIX_LENGTH + 1)}
+        return grams, prefixes, label_prefixes
+
+    def _postings(self) -> Tuple[Dict[str, Set[str]], ...]:
+        """The posting maps, in the order `_terms` returns their terms."""
+        return self._grams, self._prefixes, self._label_prefixes
+
+    def add(self, key: str, label: str, url: str) -> None:
+        """Index an entry, replacing any previous version of it."""
+        if key in self._docs:
+            self.remove(key)
+        label, url = normalize(label), target_name(url)
+        self._docs[key] = (label, url)
+        self._ranking = None
+        for postings, terms in zip(self._postings(), self._terms(label, url)):
+            for term in terms:
+                postings.setdefault(term, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        """Drop an entry from the index."""
+        label, url = self._docs.pop(key)
+        self._ranking = None
+        for postings, terms in zip(self._postings(), self._terms(label, url)):
+            for term in terms:
+                keys = postings[term]
+                keys.discard(key)
+                if not keys:
+                    del postings[term]
+
+    def _ranked(self) -> List[str]:
+        """Every key, most popular first, re-sorted only when popularity changed."""
+        generation = self.generation()
+        if self._ranking is None or generation != self._ranking_generation:
+            scores = {key: self.popularity(key) for key in self._docs}
+            self._ranking = sorted(scores, key=scores.__getitem__, reverse=True)
+            # Negated so the list ascends and can be bisected
+            self._ranking_scores = [-scores[key] for key in self._ranking]
+            self._ranking_generation = generation
+        return self._ranking
+
+    def touch(self, *keys: str) -> None:
+        """Move entries to their place in the cached ranking after one popularity change.
+
+        Only valid when that change is the single bump since the ranking was
+        built; after any other change the ranking is dropped and rebuilt on
+        the next search.
+        """
+        if self._ranking is None:
+            return
+        generation = self.generation()
+        if self._ranking_generation != generation - 1:
+            self._ranking = None
+            return
+        for key in keys:
+            if key not in self._docs:
+                continue
+            i = self._ranking.index(key)
+            del self._ranking[i]
+            del self._ranking_scores[i]
+            score = -self.popularity(key)
+            i = bisect.bisect_left(self._ranking_scores, score)
+            self._ranking.insert(i, key)
+            self._ranking_scores.insert(i, score)
+        self._ranking_generation = generation
+
+    def _most_popular(self, keys: Set[str], limit: int) -> List[str]:
+        """The most popular of some keys."""
+        if len(keys) <= self.DIRECT_RANK_LIMIT:
+            return heapq.nlargest(limit, keys, key=self.popularity)
+        found = []
+        for key in self._ranked():
+            if key in keys:
+                found.append(key)
+                if len(found) == limit:
+                    break
+        return found
+
+    def _candidates(self, query: str) -> Tuple[Set[str], bool]:
+        """Find entries containing every gram of a query of three or more characters.
+
+        Falls back to entries sharing most grams when none contain all of
+        them; the flag tells whether the result is such a fuzzy match.
+        """
+        postings = sorted((self._grams.get(gram, set()) for gram in trigrams(query)),
+                          key=len)
+        if postings[0]:
+            candidates = set(postings[0])
+            for keys in postings[1:]:
+                candidates &= keys
+                if not candidates:
+                    break
+            if candidates:
+                return candidates, False
+
+        counts: Dict[str, int] = {}
+        for keys in postings:
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+        needed = math.ceil(len(postings) / 2)
+        return {key for key, count in counts.items() if count >= needed}, True
+
+    def _score(self, key: str, query: str, fuzzy: bool) -> float:
+        """Rank how well an entry matches, with usage as the tie-breaker."""
+        label = self._docs[key][0]
+        if fuzzy:
+            quality = 0.0
+        elif label.startswith(query):
+            quality = 3.0
+        elif f" {query}" in f" {label}":
+            quality = 2.0
+        else:
+            quality = 1.0
+        return quality + math.log1p(self.popularity(key)) / 100
+
+    def search(self, query: str, limit: int = 8) -> List[str]:
+        """Return the keys of the best matching entries."""
+        query = normalize(query)
+        if not query:
+            return self._ranked()[:limit]
+        if len(query) <= PREFIX_LENGTH:
+            # Labels starting with the query rank first, so the wider word
+            # prefix matches are only ranked when those run short
+            best = self._label_prefixes.get(query, set())
+            ranked = self._most_popular(best, limit)
+            if len(ranked) < limit:
+                rest = self._prefixes.get(query, set()) - best
+                ranked += self._most_popular(rest, limit - len(ranked))
+            return ranked
+        candidates, fuzzy = self._candidates(query)
+        return heapq.nlargest(limit, candidates,
+                              key=lambda key: self._score(key, query, fuzzy))
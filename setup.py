@@ -6,6 +6,7 @@ Handles both development installation and executable creation
 import sys
 from cx_Freeze import setup, Executable
 from pathlib import Path
+from import_budget import frozen_packages, frozen_excludes
 
 # Read version from a version file
 VERSION = "1.0.0"
@@ -26,19 +27,13 @@ required_packages = [
 
 # Build options for cx_Freeze
 build_exe_options = {
-    "packages": [
-        "customtkinter",
-        "keyboard",
-        "webbrowser",
-        "json",
-        "logging",
-        "pathlib",
-        "typing",
-    ],
-    "excludes": ["tkinter.test", "unittest"],
+    # Derived from what the launcher modules import, see import_budget.py
+    "packages": frozen_packages(),
+    "excludes": frozen_excludes(),
     "include_files": [
         "README.md",
         "LICENSE",
+        "entries.json",
     ],
     "include_msvcr": True,
 }
@@ -72,9 +67,13 @@ setup(
     package_dir={"app_launcher": "."},
     python_requires=">=3.8",
     install_requires=required_packages,
+    extras_require={
+        # Renders logos and image icons once and caches them
+        "icons": ["Pillow>=9.1"],
+    },
     entry_points={
         "console_scripts": [
-            "applauncher=launcher:main",
+            "applauncher=instance:main",
         ],
     },
     classifiers=[
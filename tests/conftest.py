@@ -0,0 +1,17 @@
+"""Make the launcher modules importable from the tests."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def log_file(tmp_path_factory):
+    """Write the launcher log under pytest's temp directory instead of the repo."""
+    from utilities import file_handler
+    # The handler opens its file on the first record, so it can still be moved
+    assert file_handler.stream is None
+    file_handler.baseFilename = str(tmp_path_factory.mktemp("logs") / "launcher.log")
+    return Path(file_handler.baseFilename)
@@ -0,0 +1,111 @@
+"""Tests for launching local commands and the launch executor."""
+import os
+import sys
+import time
+
+import pytest
+
+from catalog import Entry
+from launch import AlreadyRunning, LaunchExecutor, ProcessLauncher
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32",
+                                reason="uses a shell script as the launched program")
+
+
+class ImmediateRoot:
+    """Stands in for the Tk root, running scheduled callbacks at once."""
+
+    def after(self, delay, callback, *args):
+        callback(*args)
+
+
+class StatusLabel:
+    """Records the last text shown in the status bar."""
+
+    text = ""
+
+    def configure(self, text):
+        self.text = text
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def napper(tmp_path, monkeypatch):
+    """A program on PATH that sleeps for the seconds it is given."""
+    script = tmp_path / "napper"
+    script.write_text('#!/bin/sh\nexec sleep "$1"\n')
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return "napper"
+
+
+@pytest.fixture
+def executor():
+    executor = LaunchExecutor(ImmediateRoot(), dedupe_window=0.5)
+    yield executor
+    executor.shutdown()
+
+
+def test_single_instance_command_is_not_started_twice(napper):
+    processes = ProcessLauncher()
+    proc = processes.spawn("nap", [napper, "5"], single_instance=True)
+    try:
+        with pytest.raises(AlreadyRunning):
+            processes.spawn("nap", [napper, "5"], single_instance=True)
+        other = processes.spawn("other", [napper, "5"], single_instance=True)
+        other.kill()
+    finally:
+        proc.kill()
+
+
+def test_exited_commands_are_reaped(napper):
+    processes = ProcessLauncher()
+    proc = processes.spawn("nap", [napper, "0"], single_instance=True)
+    assert wait_for(lambda: not processes.is_running("nap"))
+    assert wait_for(lambda: "nap" not in processes._running)
+    assert proc.returncode == 0
+    # Once reaped, a single-instance command can start again
+    processes.spawn("nap", [napper, "0"], single_instance=True).wait()
+
+
+def test_repeat_clicks_on_an_entry_are_dropped(executor, napper):
+    entry = Entry("nap", "Nap", "💤", command=[napper, "0"])
+    assert executor.submit(entry)
+    assert not executor.submit(entry)
+
+
+def test_entries_running_the_same_program_do_not_block_each_other(executor, napper):
+    first = Entry("nap-a", "Nap A", "💤", command=[napper, "0"])
+    second = Entry("nap-b", "Nap B", "💤", command=[napper, "0"])
+    assert executor.submit(first)
+    assert executor.submit(second)
+
+
+def test_entry_launches_again_after_the_dedupe_window(napper):
+    executor = LaunchExecutor(ImmediateRoot(), dedupe_window=0.05)
+    try:
+        label = StatusLabel()
+        entry = Entry("nap", "Nap", "💤", command=[napper, "0"])
+        assert executor.submit(entry, label)
+        assert wait_for(lambda: label.text == "Opening Nap...")
+        time.sleep(0.05)
+        assert executor.submit(entry, label)
+    finally:
+        executor.shutdown()
+
+
+def test_failed_launch_is_reported_in_the_status_bar(executor):
+    label = StatusLabel()
+    entry = Entry("missing", "Missing", "❓", command=["no-such-program-for-tests"])
+    assert executor.submit(entry, label)
+    assert wait_for(lambda: label.text.startswith("Failed to open"))
+    assert "no-such-program-for-tests was not found" in label.text
@@ -0,0 +1,76 @@
+"""Tests for the reachability probes against a local HTTP server."""
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from catalog import Entry
+from probes import DOWN, UP, StatusProber
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers /down with 503 and everything else with 200."""
+
+    requests = 0
+
+    def do_HEAD(self):
+        type(self).requests += 1
+        self.send_response(503 if self.path == "/down" else 200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    StandInHandler.requests = 0
+    server = HTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def free_port():
+    """A local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def probe_all(prober, entries):
+    return asyncio.run(prober.probe_all(entries))
+
+
+def test_statuses_follow_the_http_response(server):
+    entries = [
+        Entry("ok", "OK", "✅", url=f"{server}/"),
+        Entry("down", "Down", "❌", url=f"{server}/down"),
+        Entry("closed", "Closed", "🚫", url=f"http://127.0.0.1:{free_port()}/"),
+    ]
+    prober = StatusProber(bridge=None, rate=1000.0, timeout=2.0)
+    assert probe_all(prober, entries) == {"ok": UP, "down": DOWN, "closed": DOWN}
+
+
+def test_results_are_cached_per_target(server):
+    entries = [Entry("ok", "OK", "✅", url=f"{server}/"),
+               Entry("same", "Same", "✅", url=f"{server}/")]
+    prober = StatusProber(bridge=None, rate=1000.0, timeout=2.0)
+    probe_all(prober, entries[:1])
+    assert probe_all(prober, entries) == {"ok": UP, "same": UP}
+    assert StandInHandler.requests == 1
+
+
+def test_unresponsive_server_times_out_as_down():
+    with socket.socket() as listener:
+        # Connections are accepted by the backlog but never answered
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        prober = StatusProber(bridge=None, timeout=0.2)
+        entry = Entry("silent", "Silent", "🤐", url=f"http://127.0.0.1:{port}/")
+        assert probe_all(prober, [entry]) == {"silent": DOWN}
@@ -1,74 +1,484 @@
 """Utility functions and classes for the launcher application."""
+import atexit
+import copy
+import heapq
 import logging
-from datetime import datetime
-from typing import Optional
-import webbrowser
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 from pathlib import Path
+from metrics import metrics
+
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread.
+
+    The stock handler formats each record on the calling thread so it can
+    be pickled; records here never leave the process, so the UI thread
+    only pays for creating the record and putting it on the queue. The
+    listener is started by the first record, so importing the module does
+    not start a thread.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, start_listener: Callable[[], None]):
+        """Initialize the handler with the function that starts its listener."""
+        super().__init__(log_queue)
+        self.started = False
+        self._start_listener = start_listener
+        self._start_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record, starting the listener first if this is the first one."""
+        if not self.started:
+            with self._start_lock:
+                if not self.started:
+                    self._start_listener()
+                    self.started = True
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unformatted."""
+        return record
+
 
 # Set up logging
 logger = logging.getLogger('launcher')
 logger.setLevel(logging.INFO)
 
-# Create handlers
+# Create handlers; the log file is only opened when the first record is
+# written and rolls over to launcher.log.1 ... .3 once it reaches 1 MiB
 console_handler = logging.StreamHandler()
-file_handler = logging.FileHandler('launcher.log')
+file_handler = RotatingFileHandler('launcher.log', maxBytes=LOG_MAX_BYTES,
+                                   backupCount=LOG_BACKUP_COUNT,
+                                   encoding='utf-8', delay=True)
 
 # Create formatters and add it to handlers
 log_format = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(log_format)
 file_handler.setFormatter(log_format)
 
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+
+def start_logging() -> None:
+    """Start the listener thread and have it write out queued records at exit."""
+    log_listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and log synchronously from then on."""
+    if queue_handler not in logger.handlers:
+        return
+    logger.addHandler(console_handler)
+    logger.addHandler(file_handler)
+    logger.removeHandler(queue_handler)
+    if queue_handler.started:
+        log_listener.stop()
+    for handler in (console_handler, file_handler):
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            # The stream may already be closed at exit, as logging.shutdown allows
+            pass
+
+
+# Records are queued by the caller and formatted and written by a listener thread
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, console_handler, file_handler,
+                             respect_handler_level=True)
+queue_handler = DeferredQueueHandler(log_queue, start_logging)
+logger.addHandler(queue_handler)
+
 
 class Analytics:
-    """Tracks application usage analytics."""
-    
+    """Tracks application usage analytics.
+
+    Events are buffered in memory and appended to a compact log by a
+    background flusher; the log is periodically folded back into
+    ``analytics.json``. The flusher keeps its own copy of the counters
+    with every logged event applied, so writing the log and the JSON
+    file never holds the lock that recording a click takes.
+
+    Clicks and launch latency are also rolled up per minute, hour and day
+    bucket and per session as events arrive, so time-window queries read
+    a handful of buckets instead of raw events. Old buckets and sessions
+    are dropped when the log is compacted.
+    """
+
+    FLUSH_BATCH_SIZE = 32
+    FLUSH_INTERVAL = 5.0
+    COMPACT_THRESHOLD = 1000
+    # Granularity -> (bucket width, retention) in seconds
+    ROLLUPS = {
+        "minute": (60, 24 * 3600),
+        "hour": (3600, 30 * 86400),
+        "day": (86400, 365 * 86400),
+    }
+    MAX_SESSIONS = 200
+
     def __init__(self):
         """Initialize analytics with default values."""
         self.analytics_file = Path('analytics.json')
-        self.data = self._load_data()
+        self.log_file = Path('analytics.log')
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._buffer = []
+        self._saved = None
+        self._log_lines = 0
+        # Bumped whenever click counts change, so rankings derived from them can be cached
+        self.revision = 0
+        self._click_listeners: List[Callable[[str], None]] = []
+        self._wakeup = threading.Event()
+        self._loaded = threading.Event()
+        self._stopping = False
+        self.session = get_session_id()
+        self.data = {"launches": 0, "button_clicks": {}}
+        self._flusher = threading.Thread(target=self._flush_worker,
+                                         name="analytics-flusher", daemon=True)
+        self._flusher.start()
 
     def _load_data(self) -> dict:
-        """Load analytics data from file."""
+        """Load analytics data from file and replay any pending log."""
+        data = {"launches": 0, "button_clicks": {}}
         try:
             if self.analytics_file.exists():
                 with open(self.analytics_file, 'r') as f:
-                    return json.load(f)
-            return {"launches": 0, "button_clicks": {}}
+                    data = json.load(f)
+                # JSON turned the bucket start times into strings
+                for name, buckets in data.get("rollups", {}).items():
+                    data["rollups"][name] = {int(start): bucket
+                                             for start, bucket in buckets.items()}
+        except Exception as e:
+            logger.error("Failed to load analytics: %s", e)
+        try:
+            if self.log_file.exists():
+                with open(self.log_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self._apply_event(data, line.rstrip("\n").split("\t"))
+                        self._log_lines += 1
         except Exception as e:
-            logger.error(f"Failed to load analytics: {e}")
-            return {"launches": 0, "button_clicks": {}}
+            logger.error("Failed to replay analytics log: %s", e)
+        return data
+
+    @staticmethod
+    def _apply_event(data: dict, event: list) -> None:
+        """Fold a single logged event into the counters."""
+        if event[0] == "launch":
+            data["launches"] += 1
+        elif event[0] == "click" and len(event) >= 2:
+            clicks = data["button_clicks"]
+            clicks[event[1]] = clicks.get(event[1], 0) + 1
+            if len(event) >= 3:
+                hourly = data.setdefault("hourly_clicks", {}).setdefault(event[2], {})
+                hourly[event[1]] = hourly.get(event[1], 0) + 1
+            if len(event) == 5:
+                Analytics._roll_up(data, float(event[3]), event[4], event[1], "clicks")
+        elif event[0] == "spawn" and len(event) >= 3:
+            stats = data.setdefault("spawn_latency", {}).setdefault(
+                event[1], {"count": 0, "total_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += float(event[2])
+            if len(event) == 5:
+                Analytics._roll_up(data, float(event[3]), event[4], event[1],
+                                   "launches", float(event[2]))
+
+    @staticmethod
+    def _roll_up(data: dict, timestamp: float, session: str, key: str, kind: str,
+                 latency_ms: Optional[float] = None) -> None:
+        """Count a click or launch in its time buckets and its session."""
+        rollups = data.setdefault("rollups", {})
+        for name, (width, _) in Analytics.ROLLUPS.items():
+            buckets = rollups.setdefault(name, {})
+            start = int(timestamp // width * width)
+            bucket = buckets.get(start)
+            if bucket is None:
+                bucket = buckets[start] = {"clicks": {}, "launches": {}, "latency_ms": {}}
+            counts = bucket[kind]
+            counts[key] = counts.get(key, 0) + 1
+            if latency_ms is not None:
+                totals = bucket["latency_ms"]
+                totals[key] = totals.get(key, 0.0) + latency_ms
+        sessions = data.setdefault("sessions", {})
+        stats = sessions.get(session)
+        if stats is None:
+            stats = sessions[session] = {"started": timestamp, "clicks": 0,
+                                         "launches": 0, "latency_ms": 0.0}
+        stats[kind] += 1
+        if latency_ms is not None:
+            stats["latency_ms"] += latency_ms
+
+    @staticmethod
+    def _prune(data: dict, now: float) -> Tuple[Dict[str, List[int]], List[str]]:
+        """Drop buckets past their retention and all but the latest sessions.
+
+        Returns the dropped bucket start times by granularity and the
+        dropped sessions.
+        """
+        stale = {}
+        for name, buckets in data.get("rollups", {}).items():
+            oldest = now - Analytics.ROLLUPS[name][1]
+            stale[name] = [start for start in buckets if start < oldest]
+            for start in stale[name]:
+                del buckets[start]
+        sessions = data.get("sessions", {})
+        dropped = []
+        if len(sessions) > Analytics.MAX_SESSIONS:
+            keep = set(heapq.nlargest(Analytics.MAX_SESSIONS, sessions,
+                                      key=lambda session: sessions[session]["started"]))
+            dropped = [session for session in sessions if session not in keep]
+            for session in dropped:
+                del sessions[session]
+        return stale, dropped
+
+    def _record(self, event: tuple) -> None:
+        """Buffer an event and wake the flusher when a batch is full."""
+        with self._lock:
+            if self._loaded.is_set():
+                self._apply_event(self.data, event)
+            self._buffer.append(event)
+            if event[0] == "click":
+                self.revision += 1
+            if len(self._buffer) >= self.FLUSH_BATCH_SIZE:
+                self._wakeup.set()
+
+    def _flush_worker(self) -> None:
+        """Load stored data, then flush buffered events on a size or time threshold."""
+        data = self._load_data()
+        self._saved = copy.deepcopy(data)
+        with self._lock:
+            # Events recorded while loading are folded in once the file is read
+            for event in self._buffer:
+                self._apply_event(data, event)
+            self.data = data
+            self.revision += 1
+            self._loaded.set()
+        while not self._stopping:
+            self._wakeup.wait(self.FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self, compact: bool = False) -> None:
+        """Append buffered events to the log, compacting when it grows large."""
+        with self._io_lock:
+            with self._lock:
+                if not self._loaded.is_set():
+                    return
+                events, self._buffer = self._buffer, []
+            if events:
+                try:
+                    with metrics.timer("analytics_flush"), \
+                            open(self.log_file, 'a', encoding='utf-8') as f:
+                        f.write("".join("\t".join(event) + "\n" for event in events))
+                except Exception as e:
+                    logger.error("Failed to write analytics log: %s", e)
+                    with self._lock:
+                        self._buffer[:0] = events
+                    return
+                for event in events:
+                    self._apply_event(self._saved, event)
+                self._log_lines += len(events)
+            if compact or self._log_lines >= self.COMPACT_THRESHOLD:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Fold the log into the counters file and truncate it."""
+        stale, dropped = self._prune(self._saved, time.time())
+        with self._lock:
+            # Only the removals found above are repeated on the live counters
+            rollups = self.data.get("rollups", {})
+            for name, starts in stale.items():
+                buckets = rollups.get(name, {})
+                for start in starts:
+                    buckets.pop(start, None)
+            sessions = self.data.get("sessions", {})
+            for session in dropped:
+                sessions.pop(session, None)
+        self.save_data()
+        try:
+            self.log_file.unlink(missing_ok=True)
+            self._log_lines = 0
+        except Exception as e:
+            logger.error("Failed to compact analytics log: %s", e)
 
     def save_data(self) -> None:
-        """Save analytics data to file."""
+        """Save the logged analytics data to file."""
         try:
-            with open(self.analytics_file, 'w') as f:
-                json.dump(self.data, f)
+            tmp_file = self.analytics_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(self._saved, f)
+            os.replace(tmp_file, self.analytics_file)
         except Exception as e:
-            logger.error(f"Failed to save analytics: {e}")
+            logger.error("Failed to save analytics: %s", e)
+
+    def close(self) -> None:
+        """Stop the flusher and persist everything that is still buffered."""
+        self._stopping = True
+        self._wakeup.set()
+        self._flusher.join(timeout=2)
+        self.flush(compact=True)
 
     def track_launch(self) -> None:
         """Track application launch."""
-        self.data["launches"] += 1
-        self.save_data()
+        self._record(("launch",))
+
+    def on_click(self, listener: Callable[[str], None]) -> None:
+        """Call a listener with the button key after each tracked click."""
+        self._click_listeners.append(listener)
 
     def track_button_click(self, button_key: str) -> None:
         """Track button click."""
-        if button_key not in self.data["button_clicks"]:
-            self.data["button_clicks"][button_key] = 0
-        self.data["button_clicks"][button_key] += 1
-        self.save_data()
+        self._record(("click", button_key, str(datetime.now().hour),
+                      f"{time.time():.0f}", self.session))
+        for listener in self._click_listeners:
+            listener(button_key)
+
+    def track_spawn_latency(self, button_key: str, latency_ms: float) -> None:
+        """Track how long a launch took from click to spawn."""
+        self._record(("spawn", button_key, f"{latency_ms:.1f}",
+                      f"{time.time():.0f}", self.session))
+
+    def click_totals(self) -> dict:
+        """A copy of the clicks per button, safe to use off the Tk thread."""
+        with self._lock:
+            return dict(self.data["button_clicks"])
+
+    def clicks_by_hour(self, hour: int) -> dict:
+        """A copy of the clicks per button recorded during an hour of the day."""
+        with self._lock:
+            return dict(self.data.get("hourly_clicks", {}).get(str(hour), {}))
+
+    def top_buttons(self, days: int = 7, limit: int = 10) -> List[Tuple[str, int]]:
+        """Most clicked buttons over the last days, read from the daily rollups."""
+        since = (time.time() // 86400 - (days - 1)) * 86400
+        totals: Dict[str, int] = {}
+        with self._lock:
+            for start, bucket in self.data.get("rollups", {}).get("day", {}).items():
+                if start >= since:
+                    for key, count in bucket["clicks"].items():
+                        totals[key] = totals.get(key, 0) + count
+        return heapq.nlargest(limit, totals.items(), key=lambda item: item[1])
+
+    def timeline(self, granularity: str, since: float = 0.0,
+                 key: Optional[str] = None) -> List[Tuple[int, int]]:
+        """Clicks per bucket start time, for one button or all of them."""
+        with self._lock:
+            buckets = self.data.get("rollups", {}).get(granularity, {})
+            series = [(start, bucket["clicks"].get(key, 0) if key is not None
+                       else sum(bucket["clicks"].values()))
+                      for start, bucket in buckets.items() if start >= since]
+        return sorted(series)
+
+    def session_stats(self, session: Optional[str] = None) -> Dict[str, float]:
+        """Clicks, launches and mean launch latency of a session, by default this one."""
+        with self._lock:
+            stats = dict(self.data.get("sessions", {}).get(session or self.session, {}))
+        launches = stats.get("launches", 0)
+        return {"clicks": stats.get("clicks", 0), "launches": launches,
+                "mean_latency_ms": stats.get("latency_ms", 0.0) / launches if launches else 0.0}
+
+    def export(self, path: Path) -> int:
+        """Write the rollups to a CSV file, returning the number of rows."""
+        import csv
+        self._loaded.wait()
+        with self._lock:
+            rows = [(name, start, key, bucket["clicks"].get(key, 0),
+                     bucket["launches"].get(key, 0), bucket["latency_ms"].get(key, 0.0))
+                    for name, buckets in self.data.get("rollups", {}).items()
+                    for start, bucket in buckets.items()
+                    for key in bucket["clicks"].keys() | bucket["launches"].keys()]
+        rows.sort()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["granularity", "bucket_start", "button", "clicks",
+                             "launches", "mean_latency_ms"])
+            for name, start, key, clicks, launches, latency in rows:
+                writer.writerow([name, datetime.fromtimestamp(start, timezone.utc)
+                                 .strftime("%Y-%m-%dT%H:%M:%SZ"),
+                                 key, clicks, launches,
+                                 f"{latency / launches:.1f}" if launches else ""])
+        return len(rows)
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after a fixed time.
+
+    When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int = 64, ttl: float = 300.0):
+        """Initialize an empty cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is cached and not expired."""
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Number of cached entries, including expired ones not yet evicted."""
+        return len(self._items)
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return a cached value, or None when missing or expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+class StartupProfiler:
+    """Records how long each startup stage takes."""
+
+    def __init__(self, start: Optional[float] = None):
+        """Start timing from the given perf_counter value or from now."""
+        self.start = start if start is not None else time.perf_counter()
+        self.stages: List[Tuple[str, float]] = []
+        self._last = self.start
+
+    def mark(self, stage: str) -> None:
+        """Close the current stage under the given name."""
+        now = time.perf_counter()
+        self.stages.append((stage, (now - self._last) * 1000))
+        self._last = now
+
+    def report(self) -> str:
+        """Format the milliseconds spent per stage."""
+        total = (self._last - self.start) * 1000
+        stages = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.stages)
+        return f"Startup timings: {stages} (total {total:.1f} ms)"
 
 def open_link(url: str, status_label: Optional[any] = None) -> None:
     """Open URL in default browser and update status."""
+    import webbrowser
+    
     try:
         webbrowser.open(url)
         if status_label:
             status_label.configure(text=f"Opening {url}...")
-        logger.info(f"Opened URL: {url}")
+        logger.info("Opened URL: %s", url)
     except Exception as e:
         error_msg = f"Failed to open {url}: {str(e)}"
         if status_label:
@@ -0,0 +1,96 @@
+"""Warm-up of likely launch targets for the launcher application."""
+import socket
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+from utilities import logger, TTLCache
+
+
+class WarmupManager:
+    """Predicts the next launches from click history and pre-resolves them.
+
+    Resolution runs on a background thread: URL hosts get a DNS lookup and
+    local commands get their executable path and environment resolved. The
+    results live in a TTL cache that the launch executor consults to tag
+    launches as warm or cold.
+    """
+
+    def __init__(self, analytics: Any, catalog: Any, launcher: Any,
+                 top_n: int = 5, ttl: float = 600.0, interval: float = 300.0):
+        """Initialize the manager without starting it."""
+        self.analytics = analytics
+        self.catalog = catalog
+        self.launcher = launcher
+        self.top_n = top_n
+        self.interval = interval
+        self.cache = TTLCache(max_size=top_n * 4, ttl=ttl)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def predict(self, now: Optional[datetime] = None) -> List[Any]:
+        """Rank entries by clicks around the current hour, then overall."""
+        hour = (now or datetime.now()).hour
+        totals = self.analytics.click_totals()
+        scores: Dict[str, float] = {}
+        for offset, weight in ((0, 1.0), (-1, 0.5), (1, 0.5)):
+            for label, count in self.analytics.clicks_by_hour((hour + offset) % 24).items():
+                scores[label] = scores.get(label, 0) + weight * count
+        ranked = sorted(self.catalog,
+                        key=lambda entry: (scores.get(entry.label, 0),
+                                           totals.get(entry.label, 0)),
+                        reverse=True)
+        return [entry for entry in ranked[:self.top_n]
+                if totals.get(entry.label, 0) > 0]
+
+    def is_warm(self, target: str) -> bool:
+        """Check whether a launch target has been pre-resolved."""
+        return target in self.cache
+
+    def warm(self, entries: List[Any]) -> int:
+        """Pre-resolve entries that are not cached yet, returning how many were."""
+        self.launcher.prepare()
+        warmed = 0
+        for entry in entries:
+            if entry.target in self.cache:
+                continue
+            try:
+                self.cache.put(entry.target, self._resolve(entry))
+                warmed += 1
+            except (OSError, ValueError) as e:
+                logger.debug("Could not warm %s: %s", entry.target, e)
+        return warmed
+
+    def _resolve(self, entry: Any) -> Dict[str, Any]:
+        """Resolve a URL host, or a local command through the process launcher's caches."""
+        if entry.command:
+            processes = self.launcher.processes
+            return {"path": processes.resolve(entry.command[0]),
+                    "env": processes.environment()}
+        parts = urlsplit(entry.url)
+        if parts.scheme in ("http", "https") and parts.hostname:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            return {"addresses": socket.getaddrinfo(parts.hostname, port,
+                                                    type=socket.SOCK_STREAM)}
+        raise ValueError(f"{entry.url} is not a web URL")
+
+    def start(self) -> None:
+        """Warm the predicted targets now and again every interval."""
+        self.launcher.is_warm = self.is_warm
+        self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background warm-up."""
+        self._stop.set()
+
+    def _run(self) -> None:
+        """Background warm-up loop."""
+        while not self._stop.is_set():
+            try:
+                warmed = self.warm(self.predict())
+                if warmed:
+                    logger.debug("Warmed %d launch targets", warmed)
+            except Exception as e:
+                logger.error("Warm-up failed: %s", e)
+            self._stop.wait(self.interval)
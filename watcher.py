@@ -0,0 +1,169 @@
+"""File change notifications for the launcher application."""
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from utilities import logger
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def read_file(path: Path) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """A file's contents and their hash, or Nones if it cannot be read."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None, None
+    return data, hashlib.sha1(data).digest()
+
+
+class FileWatcher:
+    """Reports when watched files get new contents.
+
+    Uses inotify on Linux and polls modification times elsewhere. Bursts
+    of writes are debounced into one check, and a change is only reported
+    when the file's content hash differs from the last one seen.
+    ``on_change`` gets the path and new contents on a background thread.
+    """
+
+    def __init__(self, paths: Iterable[Path], on_change: Callable[[Path, bytes], None],
+                 debounce: float = 0.25, interval: float = 1.0):
+        """Initialize the watcher without starting it."""
+        self.paths = {Path(path).resolve() for path in paths}
+        self.on_change = on_change
+        self.debounce = debounce
+        self.interval = interval
+        self._digests: Dict[Path, Optional[bytes]] = {}
+        self._timers: Dict[Path, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Record the current contents and start watching."""
+        for path in self.paths:
+            self._digests[path] = read_file(path)[1]
+        watches = self._inotify()
+        if watches is not None:
+            target, args, name = self._watch_inotify, watches, "file-watcher-inotify"
+        else:
+            target, args, name = self._watch_polling, (), "file-watcher-polling"
+        self._thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and drop pending checks."""
+        self._stop.set()
+        os.write(self._wake_w, b"x")
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _inotify(self) -> Optional[Tuple[int, Dict[int, Path]]]:
+        """Set up inotify watches on the parent directories.
+
+        Returns the inotify descriptor and the directory of each watch, or
+        None where inotify is unavailable.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        # Watching directories also catches editors that save by renaming
+        directories = {}
+        for directory in {path.parent for path in self.paths}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                logger.warning("Cannot watch %s: %s", directory,
+                               os.strerror(ctypes.get_errno()))
+                os.close(fd)
+                return None
+            directories[wd] = directory
+        return fd, directories
+
+    def _watch_inotify(self, fd: int, directories: Dict[int, Path]) -> None:
+        """Turn inotify events for watched files into debounced checks."""
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd, self._wake_r], [], [])
+                if fd not in ready:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset < len(data):
+                    wd, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size
+                    name = data[offset:offset + length].rstrip(b"\0")
+                    offset += length
+                    if wd in directories and name:
+                        path = directories[wd] / os.fsdecode(name)
+                        if path in self.paths:
+                            self._schedule(path)
+        finally:
+            os.close(fd)
+
+    def _watch_polling(self) -> None:
+        """Check modification times every interval."""
+        def stamp(path: Path):
+            try:
+                stat = path.stat()
+                return stat.st_mtime_ns, stat.st_size
+            except OSError:
+                return None
+
+        stamps = {path: stamp(path) for path in self.paths}
+        while not self._stop.wait(self.interval):
+            for path in self.paths:
+                current = stamp(path)
+                if current != stamps[path]:
+                    stamps[path] = current
+                    self._schedule(path)
+
+    def _schedule(self, path: Path) -> None:
+        """Check a file once writes to it have settled."""
+        with self._lock:
+            if self._stop.is_set():
+                return
+            timer = self._timers.get(path)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.debounce, self._check, args=(path,))
+            timer.daemon = True
+            self._timers[path] = timer
+            timer.start()
+
+    def _check(self, path: Path) -> None:
+        """Report a file if its contents changed since the last check."""
+        with self._lock:
+            self._timers.pop(path, None)
+        data, digest = read_file(path)
+        if digest is None or digest == self._digests.get(path):
+            return
+        self._digests[path] = digest
+        try:
+            self.on_change(path, data)
+        except Exception as e:
+            logger.error("Failed to handle change to %s: %s", path, e)